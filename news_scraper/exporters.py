@@ -0,0 +1,55 @@
+# Define your item exporters here
+#
+# See documentation in:
+# https://docs.scrapy.org/en/latest/topics/exporters.html
+
+"""
+基于orjson的JSON Lines导出器
+orjson未安装时退化为Scrapy自带的JsonLinesItemExporter
+"""
+
+from scrapy.exporters import JsonLinesItemExporter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+class OrjsonItemExporter(JsonLinesItemExporter):
+    """
+    JSON Lines导出器
+    使用orjson序列化Item，每行一条数据
+    """
+
+    def __init__(self, file, **kwargs):
+        super().__init__(file, **kwargs)
+        # orjson只输出未转义的UTF-8，未指定编码时父类会转义非ASCII字符
+        self._use_orjson = (
+            orjson is not None
+            and bool(self.encoding)
+            and self.encoding.lower().replace("-", "") == "utf8"
+        )
+
+    def export_item(self, item):
+        """
+        导出单个Item
+
+        Args:
+            item: Scrapy Item对象
+        """
+        if not self._use_orjson:
+            return super().export_item(item)
+
+        data = dict(self.get_serialized_fields(item))
+        # orjson不支持的类型（集合、嵌套Item等）交给ScrapyJSONEncoder处理，
+        # 时间类型也交给它处理，保证输出与JsonLinesItemExporter一致
+        self.file.write(
+            orjson.dumps(
+                data,
+                default=self.encoder.default,
+                option=orjson.OPT_APPEND_NEWLINE
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        )
@@ -3,24 +3,43 @@
 # See documentation in:
 # https://docs.scrapy.org/en/latest/topics/items.html
 
+import re
+import time
 import scrapy
 import hashlib
 import datetime
-from itemloaders.processors import MapCompose, TakeFirst
+from functools import lru_cache
+from typing import Any, List
+from itemloaders.processors import TakeFirst
 from itemloaders import ItemLoader
 
+# 连续空白字符
+_WS_RE = re.compile(r"\s+")
 
-def generate_news_id(url: str) -> str:
+# 需要清理空白的文本字段，由NewsItemLoader直接调用clean_text处理
+_TEXT_FIELDS = frozenset({"title", "content", "summary", "author"})
+
+# 抓取时间缓存: [unix秒, ISO字符串]，同一秒内抓取的数据共用一个时间字符串
+_ts_cache: List[Any] = [0, ""]
+
+
+@lru_cache(maxsize=131072)
+def generate_news_id(url: str, algo: str = "blake2b") -> str:
     """
     根据url生成新闻id
+    默认使用BLAKE2b-128，长度与MD5相同（32位十六进制），不影响news_id索引
+    结果会被缓存，同一URL在加载器和去重管道中只需计算一次
     Args:
         url (str): 新闻url
+        algo (str): 哈希算法，blake2b（默认）或md5（兼容旧数据）
     Returns:
         str: 新闻id
     """
     if not url:
         return ""
-    return hashlib.md5(url.encode("utf-8")).hexdigest()
+    if algo == "md5":
+        return hashlib.md5(url.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def clean_text(text: str) -> str:
@@ -33,7 +52,21 @@ def clean_text(text: str) -> str:
     """
     if not text:
         return ""
-    return " ".join(text.split()).strip()
+    return _WS_RE.sub(" ", text).strip()
+
+
+def current_crawl_time() -> str:
+    """
+    获取当前抓取时间（精确到秒的ISO格式），同一秒内复用缓存结果
+    多线程下可能重复计算，但写入的值相同，无需加锁
+    Returns:
+        str: ISO格式时间字符串
+    """
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[1] = datetime.datetime.fromtimestamp(now).isoformat()
+        _ts_cache[0] = now
+    return _ts_cache[1]
 
 
 class NewsItem(scrapy.Item):
@@ -42,20 +75,12 @@ class NewsItem(scrapy.Item):
     定义所有可能的新闻字段
     """
 
-    news_id = scrapy.Field(serializer=str)  # 新闻唯一标识符（基于URL的MD5）
-    title = scrapy.Field(
-        input_processor=MapCompose(clean_text), out_processor=TakeFirst()
-    )  # 新闻标题
+    news_id = scrapy.Field(serializer=str)  # 新闻唯一标识符（基于URL的BLAKE2b-128）
+    title = scrapy.Field(out_processor=TakeFirst())  # 新闻标题
     url = scrapy.Field(out_processor=TakeFirst())  # 新闻原始URL
-    content = scrapy.Field(
-        input_processor=MapCompose(clean_text), out_processor=TakeFirst()
-    )  # 新闻内容
-    summary = scrapy.Field(
-        input_processor=MapCompose(clean_text), out_processor=TakeFirst()
-    )  # 新闻摘要
-    author = scrapy.Field(
-        input_processor=MapCompose(clean_text), out_processor=TakeFirst()
-    )  # 新闻作者/记者
+    content = scrapy.Field(out_processor=TakeFirst())  # 新闻内容
+    summary = scrapy.Field(out_processor=TakeFirst())  # 新闻摘要
+    author = scrapy.Field(out_processor=TakeFirst())  # 新闻作者/记者
     publish_time = scrapy.Field(out_processor=TakeFirst())  # 新闻发布时间
     update_time = scrapy.Field(out_processor=TakeFirst())  # 新闻更新时间
     category = scrapy.Field()  # 新闻分类
@@ -81,6 +106,14 @@ class NewsItemLoader(ItemLoader):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+    def _process_input_value(self, field_name, value):
+        """
+        处理输入值，文本字段直接调用clean_text，跳过MapCompose的调用开销
+        """
+        if field_name in _TEXT_FIELDS:
+            return [clean_text(v) for v in value]
+        return super()._process_input_value(field_name, value)
+
     def load_item(self):
         """
         加载新闻数据模型并生成对应的新闻ID
@@ -89,10 +122,12 @@ class NewsItemLoader(ItemLoader):
 
         # 如果没有news_id，则根据URL自动生成
         if not item.get("news_id") and item.get("url"):
-            item["news_id"] = generate_news_id(item["url"])
+            item["news_id"] = generate_news_id(
+                item["url"], self.context.get("news_id_algo", "blake2b")
+            )
 
         # 如果没有crawl_time，则使用当前时间
         if not item.get("crawl_time"):
-            item["crawl_time"] = datetime.datetime.now().isoformat()
+            item["crawl_time"] = current_crawl_time()
 
         return item
@@ -4,15 +4,225 @@
 # See: https://docs.scrapy.org/en/latest/topics/item-pipeline.html
 
 
+import re
+import json
+import atexit
+import hashlib
 import logging
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
 from itemadapter import ItemAdapter
 from scrapy.exceptions import DropItem
+from news_scraper.items import generate_news_id
+from news_scraper.utils.date_parser import parse_date
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pymongo
+    from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+    from pymongo.errors import BulkWriteError
+except ImportError:
+    # pymongo未安装时在open_spider中报错
+    pymongo = None  # type: ignore[assignment]
+    ASCENDING = DESCENDING = None  # type: ignore[assignment]
+    IndexModel = UpdateOne = BulkWriteError = None  # type: ignore[assignment,misc]
+
+try:
+    from pybloom_live import (  # type: ignore[import-not-found,import-untyped]
+        ScalableBloomFilter,
+    )
+except ImportError:
+    # 未安装pybloom_live时退化为普通集合
+    ScalableBloomFilter = None  # type: ignore[assignment,misc]
+
+# MongoDB客户端缓存，同一进程内的多个爬虫按(URI, 压缩算法)共用连接，进程退出时统一关闭
+_CLIENT_CACHE: Dict[Tuple[str, str], Any] = {}
+
+# MongoDB唯一索引冲突错误码
+_DUPLICATE_KEY_ERROR = 11000
+# url唯一索引的键模式
+_URL_KEY_PATTERN = {"url": 1}
+# 计算数据哈希时忽略的字段
+_HASH_EXCLUDED_FIELDS = frozenset({"crawl_time", "_content_hash"})
+
+# 必填字段
+_REQUIRED_FIELDS = ("title", "url", "source_name")
+
+# 有效的URL协议前缀
+_URL_PREFIXES = ("http://", "https://")
+
+# 连续空白字符
+_WS_RE = re.compile(r"\s+")
+# 常见的标题后缀（网站名）
+_TITLE_SUFFIXES = (" - CNN", " - BBC News", " | Reuters")
+# 按长度查找后缀的表：只需截取标题末尾做一次集合查找
+_TITLE_SUFFIX_SET = frozenset(_TITLE_SUFFIXES)
+_TITLE_SUFFIX_LENS = sorted({len(s) for s in _TITLE_SUFFIXES}, reverse=True)
+# URL中的追踪参数
+_TRACKING_PARAMS = frozenset(
+    {
+        "utm_source",
+        "utm_medium",
+        "utm_campaign",
+        "utm_term",
+        "utm_content",
+        "fbclid",
+        "gclid",
+        "ref",
+        "mc_cid",
+        "mc_eid",
+    }
+)
+# 需要标准化的时间字段
+_TIME_FIELDS = ("publish_time", "update_time", "crawl_time")
+
+
+def _strip_title_suffix(title: str) -> str:
+    """
+    移除标题末尾的网站名后缀
 
+    Args:
+        title: 已确认以某个后缀结尾的标题
 
-class NewsScraperPipeline:
-    def process_item(self, item, spider):
-        return item
+    Returns:
+        移除后缀后的标题
+    """
+    for length in _TITLE_SUFFIX_LENS:
+        if title[-length:] in _TITLE_SUFFIX_SET:
+            return title[:-length].strip()
+    return title
+
+
+@lru_cache(maxsize=4096)
+def _strip_tracking_params(url: str) -> str:
+    """
+    移除URL中的追踪参数，保留文章ID等有效参数
+
+    Args:
+        url: URL字符串
+
+    Returns:
+        移除追踪参数后的URL字符串
+    """
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    # 直接过滤原始的键值对，不重新编码，避免改写无值参数、分号和百分号编码
+    pairs = parts.query.split("&")
+    kept = [
+        pair
+        for pair in pairs
+        if unquote_plus(pair.partition("=")[0]).lower() not in _TRACKING_PARAMS
+    ]
+    if len(kept) == len(pairs):
+        return url
+    return urlunsplit(parts._replace(query="&".join(kept)))
+
+
+def _dedup_key(news_id: str) -> bytes:
+    """
+    将新闻ID转换为去重使用的键
+
+    Args:
+        news_id: 新闻ID
+
+    Returns:
+        十六进制ID返回其原始摘要字节，其他自定义ID返回UTF-8编码
+    """
+    if not news_id:
+        return b""
+    try:
+        return bytes.fromhex(news_id)
+    except ValueError:
+        return news_id.encode("utf-8")
+
+
+def _standardize_time_str(time_str: str) -> str:
+    """
+    将时间字符串标准化为ISO 8601格式，解析规则与utils.date_parser保持一致
+
+    Args:
+        time_str: 时间字符串
+
+    Returns:
+        标准时间字符串，无法识别的格式原样返回
+    """
+    parsed = parse_date(time_str)
+    return parsed.isoformat() if parsed else time_str
+
+
+def _item_hash(data: dict) -> bytes:
+    """
+    计算数据的哈希，用于判断文档内容是否变化
+
+    Args:
+        data: 待写入的数据字典
+
+    Returns:
+        8字节的哈希摘要
+    """
+    payload = json.dumps(
+        {k: v for k, v in data.items() if k not in _HASH_EXCLUDED_FIELDS},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).digest()
+
+
+def _get_client(mongo_uri: str, compressors: str = ""):
+    """
+    获取（或创建并缓存）指定URI和压缩算法的MongoClient
+
+    Args:
+        mongo_uri: MongoDB连接URI
+        compressors: 线协议压缩算法，按优先级逗号分隔，未安装的算法会被跳过
+
+    Returns:
+        MongoClient实例
+    """
+    # 连接选项不同的爬虫不能共用同一个客户端
+    key = (mongo_uri, compressors)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        options: Dict[str, Any] = {"maxPoolSize": 50, "retryWrites": True}
+        if compressors:
+            options["compressors"] = compressors
+            options["zlibCompressionLevel"] = 3
+        client = _CLIENT_CACHE[key] = pymongo.MongoClient(mongo_uri, **options)
+    return client
+
+
+@atexit.register
+def _close_clients():
+    """进程退出时关闭所有缓存的MongoDB连接"""
+    for client in _CLIENT_CACHE.values():
+        client.close()
+    _CLIENT_CACHE.clear()
+
+
+def _normalize_image_url(img_url: str):
+    """
+    标准化图片URL
+
+    Args:
+        img_url: 图片URL
+
+    Returns:
+        标准化后的URL，无效URL返回None
+    """
+    img_url = img_url.strip()
+    # 确保是有效的URL
+    if not img_url.startswith(("http://", "https://", "//")):
+        return None
+    # 处理协议相对URL
+    if img_url.startswith("//"):
+        img_url = "https:" + img_url
+    return img_url
 
 
 class ValidationPipeline:
@@ -21,15 +231,12 @@ class ValidationPipeline:
     验证必填字段和数据格式
     """
 
-    required_fields = ["title", "url", "source_name"]
+    required_fields = _REQUIRED_FIELDS
 
     # 最小内容长度（字符数）
     MIN_TITLE_LENGTH = 10
     MIN_CONTENT_LENGTH = 50
 
-    def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__name__)
-
     def process_item(self, item, spider):
         """
         验证数据完整性
@@ -44,51 +251,83 @@ class ValidationPipeline:
         Raises:
             DropItem: 验证失败
         """
+        get = item.get
+        min_title_length = self.MIN_TITLE_LENGTH
+        min_content_length = self.MIN_CONTENT_LENGTH
 
         # 验证必填字段
-        for field in self.required_fields:
-            if not item.get(field):
-                raise DropItem(
-                    f'❌ 缺少必填字段: {field}, URL: {item.get("url", "unknown")}'
-                )
+        missing = next(
+            (field for field in self.required_fields if not get(field)), None
+        )
+        if missing:
+            raise DropItem(f'❌ 缺少必填字段: {missing}, URL: {get("url", "unknown")}')
 
         # 验证标题长度
-        title = item.get("title", "")
-        if len(title) < self.MIN_TITLE_LENGTH:
-            raise DropItem(
-                f"❌ 标题过短 ({len(title)} < {self.MIN_TITLE_LENGTH}): {title}"
-            )
+        title = get("title", "")
+        if len(title) < min_title_length:
+            raise DropItem(f"❌ 标题过短 ({len(title)} < {min_title_length}): {title}")
 
         # 验证内容长度
-        content = item.get("content", "")
+        content = get("content", "")
         if isinstance(content, list):
             content = " ".join(content)
-        if content and len(content) < self.MIN_CONTENT_LENGTH:
+        if content and len(content) < min_content_length:
             spider.logger.warning(
-                f'⚠ 内容较短 ({len(content)} < {self.MIN_CONTENT_LENGTH}): {item.get("url")}'
+                f'⚠ 内容较短 ({len(content)} < {min_content_length}): {get("url")}'
             )
 
         # 验证URL格式
-        url = item.get("url", "")
-        if not url.startswith(("http://", "https://")):
+        url = get("url", "")
+        if not url.startswith(_URL_PREFIXES):
             raise DropItem(f"❌ 无效的URL格式: {url}")
 
-        self.logger.debug(f"✅ 数据完整性验证通过: {title[:50]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"✅ 数据完整性验证通过: {title[:50]}...")
         return item
 
 
 class DeduplicationPipeline:
     """
     去重管道
-    基于URL和新闻ID进行内存级去重
+    基于新闻ID进行内存级去重（新闻ID由URL哈希生成，无需再单独记录URL）
+    安装pybloom_live时使用可扩展布隆过滤器，大规模采集时内存占用显著降低
     """
 
-    def __init__(self):
-        self.seen_ids = set()
-        self.seen_urls = set()
-        self.logger = logging.getLogger(self.__class__.__name__)
+    def __init__(
+        self, bloom_capacity=100_000, bloom_error_rate=1e-6, recent_size=10_000
+    ):
+        # 存储16字节的原始摘要而非32位十六进制字符串，减少内存占用
+        if ScalableBloomFilter is not None:
+            self.seen_ids = ScalableBloomFilter(
+                initial_capacity=bloom_capacity, error_rate=bloom_error_rate
+            )
+            # 最近的新闻ID精确集合，重复数据通常集中出现，可直接命中而无需计算布隆过滤器哈希
+            # 注意：该窗口只用于加速，不能消除布隆过滤器的误判
+            self._recent = deque(maxlen=recent_size) if recent_size > 0 else None
+        else:
+            # 普通集合本身即为精确查找，无需额外窗口
+            self.seen_ids = set()
+            self._recent = None
+        self._recent_set = set()
         self.duplicate_count = 0
 
+    @classmethod
+    def from_crawler(cls, crawler):
+        """
+        从Scrapy settings中读取布隆过滤器配置
+
+        Args:
+            crawler: Scrapy爬虫对象
+
+        Returns:
+            DeduplicationPipeline实例
+        """
+        return cls(
+            bloom_capacity=crawler.settings.getint("DEDUP_BLOOM_CAPACITY", 100_000),
+            bloom_error_rate=crawler.settings.getfloat("DEDUP_BLOOM_FP", 1e-6),
+            recent_size=crawler.settings.getint("DEDUP_RECENT_SIZE", 10_000),
+        )
+
     def process_item(self, item, spider):
         """
         检查重复
@@ -103,24 +342,33 @@ class DeduplicationPipeline:
         Raises:
             DropItem: 发现重复
         """
-
-        # URL 去重
         url = item.get("url", "")
-        if url in self.seen_urls:
-            self.duplicate_count += 1
-            raise DropItem(f"🔄 重复URL: {url}")
-        self.seen_urls.add(url)
+        news_id = item.get("news_id") or generate_news_id(url)
+        key = _dedup_key(news_id)
 
-        # ID去重
-        news_id = item.get("news_id", "")
-        if news_id in self.seen_ids:
+        if key in self._recent_set or key in self.seen_ids:
             self.duplicate_count += 1
-            raise DropItem(f"🔄 重复新闻ID: {news_id}")
-        self.seen_ids.add(news_id)
+            raise DropItem(f"🔄 重复新闻: {url}")
+        self.seen_ids.add(key)
+        if self._recent is not None:
+            self._remember(key)
 
-        self.logger.debug(f'✅ 新内容: {item.get("title", "")[:50]}...')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'✅ 新内容: {item.get("title", "")[:50]}...')
         return item
 
+    def _remember(self, key):
+        """
+        记录最近的新闻ID，超出窗口大小时淘汰最早的记录
+
+        Args:
+            key: 新闻ID摘要
+        """
+        if len(self._recent) == self._recent.maxlen:
+            self._recent_set.discard(self._recent[0])
+        self._recent.append(key)
+        self._recent_set.add(key)
+
     def close_spider(self, spider):
         """
         爬虫关闭时输出去重统计
@@ -128,7 +376,8 @@ class DeduplicationPipeline:
         Args:
             spider: Spider对象
         """
-        self.logger.info(f"去重统计: 发现 {self.duplicate_count} 条重复数据")
+        logger.info(f"去重统计: 发现 {self.duplicate_count} 条重复数据")
+        logger.debug("新闻ID缓存统计: %s", generate_news_id.cache_info())
 
 
 class DataCleaningPipeline:
@@ -137,9 +386,6 @@ class DataCleaningPipeline:
     标准化和清洗各类数据
     """
 
-    def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__name__)
-
     def process_item(self, item, spider):
         """
         清洗数据
@@ -151,20 +397,40 @@ class DataCleaningPipeline:
         Returns:
             清洗后的Item
         """
-        # 清洗标题
-        if item.get("title"):
-            item["title"] = self._clean_title(item["title"])
+        self._clean_all(item)
+        return item
+
+    def _clean_all(self, item):
+        """
+        单次遍历清洗所有字段，每个文本字段只扫描一遍
 
-        # 清洗内容
-        if item.get("content"):
-            item["content"] = self._clean_content(item["content"])
+        Args:
+            item: NewsItem对象
+        """
+        # 清洗标题：合并空白并移除常见的标题后缀（如网站名）
+        title = item.get("title")
+        if title:
+            title = _WS_RE.sub(" ", title).strip()
+            if title.endswith(_TITLE_SUFFIXES):
+                title = _strip_title_suffix(title)
+            item["title"] = title
+
+        # 清洗内容：移除多余空白，保留段落结构
+        content = item.get("content")
+        if content:
+            if isinstance(content, list):
+                content = "\n".join(content)
+            item["content"] = "\n".join(
+                stripped for line in content.split("\n") if (stripped := line.strip())
+            )
 
         # 清洗摘要
-        if item.get("summary"):
-            item["summary"] = self._clean_text(item["summary"])
+        summary = item.get("summary")
+        if summary:
+            item["summary"] = _WS_RE.sub(" ", summary).strip()
 
         # 标准化时间格式
-        for time_field in ["publish_time", "update_time", "crawl_time"]:
+        for time_field in _TIME_FIELDS:
             if item.get(time_field):
                 item[time_field] = self._standardize_time(item[time_field])
 
@@ -180,63 +446,6 @@ class DataCleaningPipeline:
         if item.get("tags"):
             item["tags"] = self._clean_tags(item["tags"])
 
-        return item
-
-    def _clean_title(self, title: str) -> str:
-        """
-        清洗标题
-
-        Args:
-            title: 标题字符串
-
-        Returns:
-            清洗后的标题字符串
-        """
-        if not title:
-            return ""
-        # 移除多余空格
-        title = " ".join(title.split())
-        # 移除特殊字符
-        title = title.strip("\n\r\t")
-        # 移除常见的标题后缀（如网站名）
-        for suffix in [" - CNN", " - BBC News", " | Reuters"]:
-            if title.endswith(suffix):
-                title = title[: -len(suffix)].strip()
-        return title
-
-    def _clean_content(self, content) -> str:
-        """
-        清洗正文
-
-        Args:
-            content: 正文字符串或列表
-
-        Returns:
-            清洗后的正文字符串
-        """
-        if isinstance(content, list):
-            content = "\n".join(content)
-        if not content:
-            return ""
-        # 移除多余空白，保留段落结构
-        lines = content.split("\n")
-        cleaned_lines = [line.strip() for line in lines if line.strip()]
-        return "\n".join(cleaned_lines)
-
-    def _clean_text(self, text: str) -> str:
-        """
-        清洗文章摘要文本
-
-        Args:
-            text: 文章摘要文本
-
-        Returns:
-            清洗后的文章摘要文本
-        """
-        if not text:
-            return ""
-        return " ".join(text.split()).strip()
-
     def _standardize_time(self, time_str) -> str:
         """
         标准化时间格式为ISO 8601
@@ -250,9 +459,8 @@ class DataCleaningPipeline:
         if isinstance(time_str, datetime):
             return time_str.isoformat()
 
-        # 如果已经是ISO格式，直接返回
         if isinstance(time_str, str):
-            return time_str.strip()
+            return _standardize_time_str(time_str.strip())
         return str(time_str)
 
     def _clean_url(self, url: str) -> str:
@@ -270,7 +478,7 @@ class DataCleaningPipeline:
         url = url.strip()
 
         if "?" in url:
-            url = url.split("?")[0]
+            url = _strip_tracking_params(url)
 
         return url
 
@@ -290,17 +498,9 @@ class DataCleaningPipeline:
         if isinstance(images, str):
             images = [images]
 
-        cleaned = []
-        for img_url in images:
-            img_url = img_url.strip()
-            # 确保是有效的URL
-            if img_url.startswith(("http://", "https://", "//")):
-                # 处理协议相对URL
-                if img_url.startswith("//"):
-                    img_url = "https:" + img_url
-                cleaned.append(img_url)
-
-        return cleaned
+        # 清洗并去重（保持顺序），无效URL被标准化为None后移除
+        normalized = (_normalize_image_url(img_url) for img_url in images if img_url)
+        return [img_url for img_url in dict.fromkeys(normalized) if img_url]
 
     def _clean_tags(self, tags) -> list:
         """
@@ -318,16 +518,10 @@ class DataCleaningPipeline:
         if isinstance(tags, str):
             tags = [tags]
 
-        # 清洗并去重
-        cleaned = []
-        seen = set()
-        for tag in tags:
-            tag = tag.strip().lower()
-            if tag and tag not in seen:
-                seen.add(tag)
-                cleaned.append(tag)
-
-        return cleaned
+        # 清洗并去重（保持顺序）
+        return list(
+            dict.fromkeys(cleaned for tag in tags if (cleaned := tag.strip().lower()))
+        )
 
 
 class MongoDBPipeline:
@@ -336,16 +530,31 @@ class MongoDBPipeline:
     将数据存储到MongoDB数据库
     """
 
-    def __init__(self, mongo_uri, mongo_db, collection_name):
+    def __init__(
+        self,
+        mongo_uri,
+        mongo_db,
+        collection_name,
+        batch_size=200,
+        compressors="",
+        store_raw_html=False,
+    ):
         self.mongo_uri = mongo_uri
+        self.compressors = compressors
+        # 是否保存原始HTML，关闭时只保存其摘要
+        self.store_raw_html = store_raw_html
         self.mongo_db = mongo_db
         self.collection_name = collection_name
         self.client = None
         self.db = None
         self.collection = None
-        self.logger = logging.getLogger(self.__class__.__name__)
         self.saved_count = 0
         self.updated_count = 0
+        self.unchanged_count = 0
+        self.failed_count = 0
+        # 批量写入缓冲区，攒够batch_size条后通过bulk_write一次性提交
+        self.batch_size = batch_size
+        self._buf = []
 
     @classmethod
     def from_crawler(cls, crawler):
@@ -362,6 +571,9 @@ class MongoDBPipeline:
             mongo_uri=crawler.settings.get("MONGO_URI", "mongodb://localhost:27017"),
             mongo_db=crawler.settings.get("MONGO_DATABASE", "news_scraper"),
             collection_name=crawler.settings.get("MONGO_COLLECTION", "news"),
+            batch_size=crawler.settings.getint("MONGO_BATCH_SIZE", 200),
+            compressors=crawler.settings.get("MONGO_COMPRESSORS", ""),
+            store_raw_html=crawler.settings.getbool("STORE_RAW_HTML", False),
         )
 
     def open_spider(self, spider):
@@ -372,19 +584,15 @@ class MongoDBPipeline:
             spider: Scrapy爬虫对象
         """
         try:
-            import pymongo
+            if pymongo is None:
+                raise ImportError("No module named 'pymongo'")
 
-            self.client = pymongo.MongoClient(self.mongo_uri)
+            self.client = _get_client(self.mongo_uri, self.compressors)
             self.db = self.client[self.mongo_db]
             self.collection = self.db[self.collection_name]
 
-            # 创建索引
-            self.collection.create_index("url", unique=True)
-            self.collection.create_index("news_id", unique=True)
-            self.collection.create_index("publish_time")
-            self.collection.create_index("source_name")
-            self.collection.create_index("category")
-            self.collection.create_index([("source_name", 1), ("publish_time", -1)])
+            # 创建索引（已存在的索引跳过，缺失的索引一次性在后台创建）
+            self._ensure_indexes()
 
             spider.logger.info(
                 f"✅ MongoDB连接成功: {self.mongo_db}.{self.collection_name}"
@@ -397,47 +605,136 @@ class MongoDBPipeline:
             spider.logger.error(f"❌ MongoDB连接失败: {e}")
             raise
 
+    def _ensure_indexes(self):
+        """
+        批量创建缺失的索引
+        """
+        models = [
+            IndexModel([("url", ASCENDING)], unique=True, background=True),
+            IndexModel([("news_id", ASCENDING)], unique=True, background=True),
+            IndexModel([("publish_time", ASCENDING)], background=True),
+            IndexModel([("source_name", ASCENDING)], background=True),
+            IndexModel([("category", ASCENDING)], background=True),
+            IndexModel(
+                [("source_name", ASCENDING), ("publish_time", DESCENDING)],
+                background=True,
+            ),
+        ]
+        existing = set(self.collection.index_information())
+        missing = [m for m in models if m.document["name"] not in existing]
+        if missing:
+            self.collection.create_indexes(missing)
+
     def close_spider(self, spider):
         """
-        爬虫关闭时断开连接
+        爬虫关闭时写入剩余数据并释放连接
 
         Args:
             spider: Scrapy爬虫对象
         """
         if self.client:
-            self.client.close()
-            spider.logger.info("✅ MongoDB连接已关闭")
+            # 写入缓冲区中剩余的数据
+            self._flush(spider)
+            # 连接由_CLIENT_CACHE复用，进程退出时关闭
+            self.client = None
             spider.logger.info(
-                f"存储统计: 新增 {self.saved_count} 条, 更新 {self.updated_count} 条"
+                f"存储统计: 新增 {self.saved_count} 条, 更新 {self.updated_count} 条, "
+                f"未变化 {self.unchanged_count} 条, 失败 {self.failed_count} 条"
             )
 
     def process_item(self, item, spider):
         """
-        存储数据到MongoDB
+        将数据加入批量写入缓冲区，缓冲区满时写入MongoDB
 
         Args:
             item: Scrapy Item对象
             spider: Scrapy爬虫对象
         """
-        try:
-            # 转换为字典
-            data = dict(item)
-
-            # 使用upsert避免重复
-            result = self.collection.update_one(
-                {"url": data["url"]}, {"$set": data}, upsert=True
+        # 转换为字典
+        data = dict(item)
+
+        # 原始HTML体积较大，默认只保存摘要
+        if not self.store_raw_html:
+            raw_html = data.pop("raw_html", None)
+            if raw_html:
+                data["raw_html_hash"] = hashlib.blake2b(
+                    raw_html.encode("utf-8"), digest_size=16
+                ).hexdigest()
+
+        # 记录整条数据的哈希（不含每次都会变化的采集时间），未变化的文档不会被重复写入
+        content_hash = _item_hash(data)
+        data["_content_hash"] = content_hash
+
+        # 使用upsert避免重复，数据库中内容哈希相同的文档不会被匹配
+        # 此时upsert会因url唯一索引冲突而失败，视为内容未变化
+        self._buf.append(
+            UpdateOne(
+                {"url": data["url"], "_content_hash": {"$ne": content_hash}},
+                {"$set": data},
+                upsert=True,
             )
+        )
+
+        if len(self._buf) >= self.batch_size:
+            self._flush(spider)
 
-            if result.upserted_id:
-                self.saved_count += 1
-                spider.logger.debug(f'💾 新增: {data.get("title", "")[:50]}...')
-            else:
-                self.updated_count += 1
-                spider.logger.debug(f'🔄 更新: {data.get("title", "")[:50]}...')
+        return item
 
+    def _flush(self, spider):
+        """
+        通过bulk_write批量提交缓冲区中的写操作
+
+        Args:
+            spider: Scrapy爬虫对象
+        """
+        if not self._buf:
+            return
+
+        ops, self._buf = self._buf, []
+        try:
+            result = self.collection.bulk_write(
+                ops, ordered=False, bypass_document_validation=True
+            )
+            self.saved_count += result.upserted_count
+            self.updated_count += result.modified_count
+            if spider.logger.isEnabledFor(logging.DEBUG):
+                spider.logger.debug(
+                    f"💾 批量写入 {len(ops)} 条: 新增 {result.upserted_count}, "
+                    f"更新 {result.modified_count}"
+                )
+        except BulkWriteError as e:
+            details = e.details
+            self.saved_count += details.get("nUpserted", 0)
+            self.updated_count += details.get("nModified", 0)
+            # 只有url唯一索引冲突说明数据库中已有相同内容的文档，
+            # 其他唯一索引冲突（如news_id）属于真实的写入失败
+            errors = [
+                error
+                for error in details.get("writeErrors", [])
+                if error.get("code") != _DUPLICATE_KEY_ERROR
+                or error.get("keyPattern") != _URL_KEY_PATTERN
+            ]
+            self.unchanged_count += len(details.get("writeErrors", [])) - len(errors)
+            if errors:
+                self._record_failures(spider, len(errors))
+                spider.logger.error(f"❌ MongoDB批量存储部分失败: {len(errors)} 条")
+                for error in errors[:5]:
+                    spider.logger.error(f'   {error.get("errmsg")}')
         except Exception as e:
-            spider.logger.error(f"❌ MongoDB存储失败: {e}")
-            spider.logger.error(f'   URL: {item.get("url")}')
-            raise DropItem(f'存储失败: {item.get("url")}')
+            # 整批写入失败，计入统计后继续抛出，避免数据被静默丢弃
+            self._record_failures(spider, len(ops))
+            spider.logger.error(f"❌ MongoDB批量存储失败 ({len(ops)} 条): {e}")
+            raise
 
-        return item
+    def _record_failures(self, spider, count):
+        """
+        记录写入失败的条数，同时计入Scrapy统计信息
+
+        Args:
+            spider: Scrapy爬虫对象
+            count: 失败条数
+        """
+        self.failed_count += count
+        crawler = getattr(spider, "crawler", None)
+        if crawler is not None and crawler.stats is not None:
+            crawler.stats.inc_value("mongodb/failed_count", count, spider=spider)
@@ -1,22 +1,38 @@
+import re
+import sys
 import scrapy
 from scrapy.loader import ItemLoader
+from scrapy.utils.response import get_base_url
 from datetime import datetime, timedelta
 from typing import Optional
+from urllib.parse import urljoin, urlsplit
 
 
 # 尝试导入项目模块
 try:
-    from news_scraper.items import NewsItem, NewsItemLoader, generate_news_id
-    from news_scraper.utils.extractor import MultiSiteExtractor
+    from news_scraper.items import (
+        NewsItem,
+        NewsItemLoader,
+        current_crawl_time,
+        generate_news_id,
+    )
+    from news_scraper.utils.extractor import MultiSiteExtractor, compile_selector
 except ImportError:
     # 如果在开发环境，添加路径
-    import sys
     from pathlib import Path
 
     project_root = Path(__file__).parent.parent.parent
     sys.path.insert(0, str(project_root))
-    from news_scraper.items import NewsItem, NewsItemLoader
-    from news_scraper.utils.extractor import MultiSiteExtractor
+    from news_scraper.items import (
+        NewsItem,
+        NewsItemLoader,
+        current_crawl_time,
+        generate_news_id,
+    )
+    from news_scraper.utils.extractor import MultiSiteExtractor, compile_selector
+
+# ISO 8601日期时间格式前缀
+_ISO_DATETIME_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T")
 
 
 class UniversalNewsSpider(scrapy.Spider):
@@ -48,6 +64,11 @@ class UniversalNewsSpider(scrapy.Spider):
         "ROBOTSTXT_OBEY": False,
     }
 
+    # 提取结果中不写入Item的字段
+    _EXCLUDED_FIELDS = frozenset({"article_links", "list_page_url"})
+    # 可写入Item的字段
+    _ALLOWED_FIELDS = frozenset(NewsItem.fields) - _EXCLUDED_FIELDS
+
     def __init__(
         self,
         sources: Optional[str] = None,
@@ -84,23 +105,60 @@ class UniversalNewsSpider(scrapy.Spider):
         if not self.target_sources:
             raise ValueError("没有可用的新闻源！请检查配置文件或sources参数")
 
+        # 驻留source_id字符串，以下各字典的键和请求meta中的值共用同一对象
+        self.target_sources = [sys.intern(s) for s in self.target_sources]
+
+        # 缓存各新闻源的配置和提取器，避免在请求处理中重复查找
+        self._configs = {
+            sid: self.multi_extractor.get_config(sid) for sid in self.target_sources
+        }
+        self._extractors = {
+            sid: self.multi_extractor.get_extractor(sid) for sid in self.target_sources
+        }
+        # 预编译的文章链接选择器
+        self._link_selectors = {
+            sid: compile_selector(cfg.get("selectors", {}).get("article_links", {}))
+            for sid, cfg in self._configs.items()
+            if cfg
+        }
+        self._url_validators = {
+            sid: extractor.is_valid_article_url
+            for sid, extractor in self._extractors.items()
+            if extractor
+        }
+        # 各新闻源列表页路径的最后一段与分类的对应关系，如 ("/world/", "world")
+        # 路径段两侧都带斜杠，避免 /world 误匹配 /worldwide/
+        self._category_paths = {}
+        for sid, cfg in self._configs.items():
+            paths = []
+            for page in (cfg or {}).get("list_pages", []):
+                segment = page.get("url", "").rstrip("/").rsplit("/", 1)[-1]
+                if segment:
+                    paths.append((f"/{segment}/", page.get("category", "general")))
+            self._category_paths[sid] = paths
+
         self.days_back = int(days_back)
         self.start_date = datetime.now() - timedelta(days=self.days_back)
-
-        # 输出启动信息
-        self.logger.info("=" * 60)
-        self.logger.info(f"通用新闻爬虫启动")
-        self.logger.info(
-            f'目标新闻源 ({len(self.target_sources)}): {", ".join(self.target_sources)}'
-        )
-        self.logger.info(
-            f'时间范围: 最近 {self.days_back} 天 (从 {self.start_date.strftime("%Y-%m-%d")} 起)'
-        )
-        self.logger.info("=" * 60)
+        self._start_date_iso = self.start_date.strftime("%Y-%m-%dT%H:%M:%S")
+        self._start_ts = self.start_date.timestamp()
+
+        # 输出启动信息（合并为一条日志记录）
+        lines = [
+            "=" * 60,
+            "通用新闻爬虫启动",
+            f'目标新闻源 ({len(self.target_sources)}): {", ".join(self.target_sources)}',
+            f"时间范围: 最近 {self.days_back} 天 (从 {self.start_date:%Y-%m-%d} 起)",
+            "=" * 60,
+        ]
+        self.logger.info("\n".join(lines))
 
         # 动态设置allowed_domains和start_urls
         self._setup_urls()
 
+        # ID算法和Item构建方式，由from_crawler按settings覆盖
+        self.news_id_algo = "blake2b"
+        self.fast_loader = True
+
         # 统计信息
         self.stats = {
             "pages_crawled": 0,
@@ -109,6 +167,23 @@ class UniversalNewsSpider(scrapy.Spider):
             "articles_failed": 0,
         }
 
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        """
+        从Crawler创建爬虫，读取文章处理用到的配置，并按配置启用字段并行提取
+
+        Args:
+            crawler: Scrapy Crawler对象
+        """
+        spider = super().from_crawler(crawler, *args, **kwargs)
+        # 在启动时读取一次，避免在每篇文章的处理中重复查询settings
+        spider.news_id_algo = crawler.settings.get("NEWS_ID_ALGO", "blake2b")
+        spider.fast_loader = crawler.settings.getbool("FAST_LOADER", True)
+        field_workers = crawler.settings.getint("EXTRACT_FIELD_WORKERS", 0)
+        if field_workers > 0:
+            spider.multi_extractor.set_field_workers(field_workers)
+        return spider
+
     def start_requests(self):
         """
         生成初始请求
@@ -142,8 +217,8 @@ class UniversalNewsSpider(scrapy.Spider):
             self.logger.warning(f"❌ 无法识别新闻源: {response.url}")
             return
 
-        extractor = self.multi_extractor.get_extractor(source_id)
-        config = self.multi_extractor.get_config(source_id)
+        extractor = self._extractors.get(source_id)
+        config = self._configs.get(source_id)
 
         if not extractor or not config:
             self.logger.error(f"❌ 找不到新闻源配置: {source_id}")
@@ -152,36 +227,30 @@ class UniversalNewsSpider(scrapy.Spider):
         self.logger.info(f'📄 解析列表页: {response.url} ({config.get("name")})')
 
         # 提取文章链接
-        links_config = config.get("selectors", {}).get("article_links", {})
-        article_links = extractor.extract_field(response, "article_links", links_config)
+        article_links = self._link_selectors[source_id](response)
         if not article_links:
             self.logger.warning(f"⚠ 未提取到文章链接: {response.url}")
             return
-        if isinstance(article_links, str):
-            article_links = [article_links]
 
         self.logger.info(f"📰 找到 {len(article_links)} 个文章链接")
         self.stats["articles_found"] += len(article_links)
 
-        # 遍历链接
-        for link in article_links:
-            # 构建完整URL
-            article_url = response.urljoin(link)
-
-            # 验证是否为有效文章URL
-            if not extractor.is_valid_article_url(article_url):
-                continue
+        # 构建完整URL并验证是否为有效文章URL
+        base_url = get_base_url(response)
+        is_valid_article_url = self._url_validators[source_id]
+        article_urls = [
+            url
+            for url in (urljoin(base_url, link) for link in article_links)
+            if is_valid_article_url(url)
+        ]
 
+        for article_url in article_urls:
             # 发起详情页请求
             yield scrapy.Request(
                 url=article_url,
                 callback=self.parse_article,
                 errback=self.handle_error,
-                meta={
-                    "source_id": source_id,
-                    "source_config": config,
-                    "page_type": "article",
-                },
+                meta={"source_id": source_id, "page_type": "article"},
                 dont_filter=False,
             )
 
@@ -193,13 +262,13 @@ class UniversalNewsSpider(scrapy.Spider):
         Args:
             response: Scrapy Response对象
         """
-        # 从meta中获取新闻源ID和配置
+        # 从meta中获取新闻源ID，配置从缓存中读取
         source_id = response.meta["source_id"]
-        source_config = response.meta["source_config"]
+        source_config = self._configs[source_id]
 
         try:
             # 查看是否有对应的字段提取器
-            extractor = self.multi_extractor.get_extractor(source_id)
+            extractor = self._extractors.get(source_id)
             if not extractor:
                 self.logger.error(f"❌ 找不到提取器: {source_id}")
                 return
@@ -209,8 +278,8 @@ class UniversalNewsSpider(scrapy.Spider):
             # 使用提取器提取所有字段
             extracted_data = extractor.extract_all_fields(response)
 
-            # 检查必填字段
-            if not extracted_data.get("title"):
+            # 检查必填字段（开启fast_fail时必填字段缺失会返回None）
+            if not extracted_data or not extracted_data.get("title"):
                 self.logger.error(f"❌ 标题提取失败，跳过: {response.url}")
                 self.stats["articles_failed"] += 1
                 return
@@ -219,25 +288,28 @@ class UniversalNewsSpider(scrapy.Spider):
                 self.logger.warning(f"⚠ 内容提取失败，但继续处理: {response.url}")
 
             # 构建Item
-            loader = NewsItemLoader(item=NewsItem(), response=response)
-            loader.add_value("news_id", generate_news_id(response.url))
-            loader.add_value("url", response.url)
-            loader.add_value("crawl_time", datetime.now().isoformat())
-            loader.add_value("source_name", source_config.get("name"))
-            loader.add_value("source_country", source_config.get("country"))
-            loader.add_value("language", source_config.get("language"))
-            category = self._extract_category(response.url, source_config)
-            if category:
-                loader.add_value("category", category)
+            news_id_algo = self.news_id_algo
+            base_fields = {
+                "news_id": generate_news_id(response.url, news_id_algo),
+                "url": response.url,
+                "crawl_time": current_crawl_time(),
+                "source_name": source_config.get("name"),
+                "source_country": source_config.get("country"),
+                "language": source_config.get("language"),
+                "category": self._extract_category(response.url, source_id),
+            }
+            loader = NewsItemLoader(
+                item=NewsItem(), response=response, news_id_algo=news_id_algo
+            )
+            # 这些字段无需处理器加工，FAST_LOADER开启时在load_item之后直接写入Item
+            fast_loader = self.fast_loader
+            if not fast_loader:
+                for field_name, field_value in base_fields.items():
+                    loader.add_value(field_name, field_value)
 
             # 添加提取到的字段
-            allowed_fields = set(NewsItem.fields.keys())
-            excluded_fields = {"article_links", "list_page_url"}
             for field_name, field_value in extracted_data.items():
-                # 跳过排除的字段
-                if field_name in excluded_fields:
-                    continue
-                if field_name in allowed_fields:
+                if field_name in self._ALLOWED_FIELDS:
                     loader.add_value(field_name, field_value)
 
             # 检查日期有效性
@@ -247,6 +319,10 @@ class UniversalNewsSpider(scrapy.Spider):
                 return
 
             item = loader.load_item()
+            if fast_loader:
+                for field_name, field_value in base_fields.items():
+                    if field_value:
+                        item[field_name] = field_value
             self.stats["articles_scraped"] += 1
             self.logger.info(f'✅ 成功提取: {item.get("title", "")[:50]}...')
 
@@ -281,43 +357,51 @@ class UniversalNewsSpider(scrapy.Spider):
         Args:
             reason: 关闭原因
         """
-        self.logger.info("=" * 60)
-        self.logger.info(f"爬虫关闭: {reason}")
-        self.logger.info("统计信息:")
-        self.logger.info(f'  列表页爬取: {self.stats["pages_crawled"]} 页')
-        self.logger.info(f'  文章发现: {self.stats["articles_found"]} 篇')
-        self.logger.info(f'  文章成功: {self.stats["articles_scraped"]} 篇')
-        self.logger.info(f'  文章失败: {self.stats["articles_failed"]} 篇')
-        if self.stats["articles_found"] > 0:
-            success_rate = (
-                self.stats["articles_scraped"] / self.stats["articles_found"]
-            ) * 100
-            self.logger.info(f"  成功率: {success_rate:.1f}%")
-        self.logger.info("=" * 60)
+        stats = self.stats
+        lines = [
+            "=" * 60,
+            f"爬虫关闭: {reason}",
+            "统计信息:",
+            f'  列表页爬取: {stats["pages_crawled"]} 页',
+            f'  文章发现: {stats["articles_found"]} 篇',
+            f'  文章成功: {stats["articles_scraped"]} 篇',
+            f'  文章失败: {stats["articles_failed"]} 篇',
+        ]
+        if stats["articles_found"] > 0:
+            success_rate = (stats["articles_scraped"] / stats["articles_found"]) * 100
+            lines.append(f"  成功率: {success_rate:.1f}%")
+        lines.append("=" * 60)
+        self.logger.info("\n".join(lines))
+
+        # 关闭字段提取线程池
+        self.multi_extractor.close()
 
     def _setup_urls(self):
         """
         根据配置动态设置allowed_domains和start_urls
         """
-        self.allowed_domains = []
-        self.start_urls = []
+        # 使用字典判重（O(1)查找），同时保持配置中的顺序
+        domains = {}
+        urls = {}
 
-        for source_id in self.target_sources:
-            config = self.multi_extractor.get_config(source_id)
+        for config in self._configs.values():
             if not config:
                 continue
 
             # 添加域名
             domain = config.get("domain")
-            if domain and domain not in self.allowed_domains:
-                self.allowed_domains.append(domain)
+            if domain:
+                domains.setdefault(domain, None)
 
             # 添加起始URL
             list_pages = config.get("list_pages", [])
             for page in list_pages:
                 url = page.get("url")
-                if url and url not in self.start_urls:
-                    self.start_urls.append(url)
+                if url:
+                    urls.setdefault(url, None)
+
+        self.allowed_domains = list(domains)
+        self.start_urls = list(urls)
 
         self.logger.info(f"已配置 {len(self.allowed_domains)} 个域名")
         self.logger.info(f"已配置 {len(self.start_urls)} 个起始URL")
@@ -332,39 +416,27 @@ class UniversalNewsSpider(scrapy.Spider):
         Returns:
             新闻源ID，如果无法识别返回None
         """
-        for source_id in self.target_sources:
-            config = self.multi_extractor.get_config(source_id)
-            if not config:
-                continue
-
-            domain = config.get("domain")
-            if domain and domain in url:
-                return source_id
-
-        return None
+        source_id = self.multi_extractor.get_source_by_domain(
+            urlsplit(url).hostname or ""
+        )
+        # 只识别本次要采集的新闻源
+        return source_id if source_id in self._configs else None
 
-    def _extract_category(self, url: str, config: dict) -> Optional[str]:
+    def _extract_category(self, url: str, source_id: str) -> Optional[str]:
         """
         从URL或配置中提取分类
 
         Args:
             url: 文章URL
-            config: 新闻源配置
+            source_id: 新闻源ID
 
         Returns:
             分类名称
         """
-        # 从list_pages配置中匹配分类
-        list_pages = config.get("list_pages", [])
-        for page in list_pages:
-            page_url = page.get("url", "")
-            category = page.get("category", "general")
-
-            # 简单匹配：如果文章URL包含list_page的路径
-            if page_url:
-                page_path = page_url.split("/")[-1]
-                if page_path and page_path in url:
-                    return category
+        # 简单匹配：如果文章URL包含list_page的路径
+        for page_path, category in self._category_paths.get(source_id, ()):
+            if page_path in url:
+                return category
 
         # 默认分类
         return "general"
@@ -379,8 +451,16 @@ class UniversalNewsSpider(scrapy.Spider):
         Returns:
             是否有效
         """
+        # 非字符串的值无法解析，默认采集
+        if not isinstance(date_string, str):
+            return True
+
+        # ISO格式直接按字符串比较，截取前19位（去掉时区和微秒部分）
+        if _ISO_DATETIME_RE.match(date_string):
+            return date_string[:19] >= self._start_date_iso
+
         try:
             publish_time = datetime.fromisoformat(date_string.replace("Z", "+00:00"))
-            return publish_time >= self.start_date
-        except:
+            return publish_time.timestamp() >= self._start_ts
+        except (ValueError, TypeError):
             return True  # 如果解析失败，默认采集
@@ -3,328 +3,548 @@
 """
 
 import re
+import time
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# 预编译的日期正则
+# CNN格式: Updated 10:30 AM EST, Thu December 21, 2024
+_CNN_RE = re.compile(
+    r"(\d{1,2}):(\d{2})\s*(AM|PM)\s*\w+,\s*(?:\w+,?\s+)?(\w+)\s+(\d{1,2}),\s+(\d{4})",
+    re.IGNORECASE,
+)
+# BBC格式1: 21 December 2024
+_BBC_DMY_RE = re.compile(r"(\d{1,2})\s+(\w+)\s+(\d{4})")
+# BBC格式2: December 21, 2024
+_BBC_MDY_RE = re.compile(r"(\w+)\s+(\d{1,2}),?\s+(\d{4})")
+# 相对时间中的数字
+_DIGITS_RE = re.compile(r"\d+")
+
+# 常见数字日期格式
+_YMD_RE = re.compile(
+    r"^(\d{4})-(\d{1,2})-(\d{1,2})"
+    r"(?:\s+(\d{1,2}):(\d{1,2}):(\d{1,2})(?:\.(\d{1,6}))?)?$"
+)
+_YMD_SLASH_RE = re.compile(r"^(\d{4})/(\d{1,2})/(\d{1,2})$")
+_DMY_RE = re.compile(r"^(\d{1,2})([/-])(\d{1,2})\2(\d{4})$")
+# 常见英文月份日期格式
+_DMY_TEXT_RE = re.compile(r"^(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})$")
+_MDY_TEXT_RE = re.compile(r"^([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})$")
+
+
+# 当前时间缓存: [时间戳, datetime对象]
+_NOW_CACHE: List[Any] = [0.0, None]
+
+
+def _now() -> datetime:
+    """
+    获取当前时间，0.25秒内复用同一个datetime对象
+    相对时间精度为分钟级，无需每次都读取系统时钟
 
-class DateParser:
+    Returns:
+        当前时间的datetime对象
     """
-    多格式日期解析器
-    自动识别并解析各种日期时间格式
+    t = time.time()
+    cache = _NOW_CACHE
+    if t - cache[0] > 0.25:
+        cache[0] = t
+        cache[1] = datetime.fromtimestamp(t)
+    return cache[1]
+
+
+def _build_datetime(
+    year: int,
+    month: int,
+    day: int,
+    hour: int = 0,
+    minute: int = 0,
+    second: int = 0,
+    microsecond: int = 0,
+) -> Optional[datetime]:
     """
+    构造datetime对象，日期无效时返回None
+    """
+    try:
+        return datetime(year, month, day, hour, minute, second, microsecond)
+    except ValueError:
+        return None
 
-    # 相对时间关键词映射（英文）
-    RELATIVE_PATTERNS = {
-        "just now": 0,
-        "a moment ago": 0,
-        "seconds ago": 0,
-        "a second ago": 0,
-        "a minute ago": 1,
-        "minutes ago": "minutes",
-        "an hour ago": 60,
-        "hours ago": "hours",
-        "a day ago": 1440,
-        "days ago": "days",
-        "yesterday": 1440,
-        "a week ago": 10080,
-        "weeks ago": "weeks",
-        "a month ago": 43200,
-        "months ago": "months",
-        "a year ago": 525600,
-        "years ago": "years",
-    }
-
-    # 月份映射（支持英文全称和缩写）
-    MONTH_MAPPING = {
-        # 英文全称
-        "january": 1,
-        "february": 2,
-        "march": 3,
-        "april": 4,
-        "may": 5,
-        "june": 6,
-        "july": 7,
-        "august": 8,
-        "september": 9,
-        "october": 10,
-        "november": 11,
-        "december": 12,
-        # 英文缩写
-        "jan": 1,
-        "feb": 2,
-        "mar": 3,
-        "apr": 4,
-        "may": 5,
-        "jun": 6,
-        "jul": 7,
-        "aug": 8,
-        "sep": 9,
-        "sept": 9,
-        "oct": 10,
-        "nov": 11,
-        "dec": 12,
-    }
 
-    @staticmethod
-    def parse(date_string: str, parser_type: str = "auto") -> Optional[datetime]:
-        """
-        统一的日期解析入口
-
-        Args:
-            date_string: 日期字符串
-            parser_type: 解析器类型
-                - auto: 自动检测（默认）
-                - iso8601: ISO 8601格式
-                - cnn_date: CNN特定格式
-                - bbc_date: BBC特定格式
-                - relative: 相对时间
+# 相对时间关键词映射（英文）
+RELATIVE_PATTERNS = {
+    "just now": 0,
+    "a moment ago": 0,
+    "seconds ago": 0,
+    "a second ago": 0,
+    "a minute ago": 1,
+    "minutes ago": "minutes",
+    "an hour ago": 60,
+    "hours ago": "hours",
+    "a day ago": 1440,
+    "days ago": "days",
+    "yesterday": 1440,
+    "a week ago": 10080,
+    "weeks ago": "weeks",
+    "a month ago": 43200,
+    "months ago": "months",
+    "a year ago": 525600,
+    "years ago": "years",
+}
+
+# 月份映射（支持英文全称和缩写）
+MONTH_MAPPING = {
+    # 英文全称
+    "january": 1,
+    "february": 2,
+    "march": 3,
+    "april": 4,
+    "may": 5,
+    "june": 6,
+    "july": 7,
+    "august": 8,
+    "september": 9,
+    "october": 10,
+    "november": 11,
+    "december": 12,
+    # 英文缩写
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "sept": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+# 相对时间关键词拆分为固定分钟数和需要提取数字的时间单位两张表
+_REL_FIXED_MINUTES = {
+    key: value for key, value in RELATIVE_PATTERNS.items() if isinstance(value, int)
+}
+_REL_UNIT = {
+    key: value
+    for key, value in RELATIVE_PATTERNS.items()
+    if not isinstance(value, int)
+}
+# 每个时间单位对应的分钟数（近似计算，1个月=30天，1年=365天）
+_REL_UNIT_MINUTES = {
+    "minutes": 1,
+    "hours": 60,
+    "days": 1440,
+    "weeks": 10080,
+    "months": 43200,
+    "years": 525600,
+}
+# 所有关键词的正则（长的在前，避免被较短的关键词抢先匹配）
+_REL_RE = re.compile(
+    "|".join(
+        re.escape(key) for key in sorted(RELATIVE_PATTERNS, key=len, reverse=True)
+    )
+)
+
+# 以下解析函数通过默认参数绑定模块级常量，调用时按局部变量访问
+
+
+def _parse(date_string: str, parser_type: str = "auto") -> Optional[datetime]:
+    """
+    统一的日期解析入口，见DateParser.parse
+    """
+    if not date_string:
+        return None
 
-        Returns:
-            datetime对象，失败返回None
+    # 相对时间的结果依赖当前时间，缓存中只保存偏移的分钟数
+    kind, value = _parse_to_offset(date_string.strip(), parser_type)
+    if kind == "rel_minutes":
+        return _now() - timedelta(minutes=value)
+    return value
 
-        Examples:
-            >>> DateParser.parse('2024-12-21T10:30:00Z')
-            datetime(2024, 12, 21, 10, 30, 0)
 
-            >>> DateParser.parse('5 minutes ago')
-            datetime(2024, 12, 21, 10, 25, 0)  # 相对于当前时间
-        """
-        if not date_string:
-            return None
-
-        date_string = date_string.strip()
-
-        # 根据类型选择解析器
-        if parser_type == "iso8601":
-            return DateParser._parse_iso8601(date_string)
-        elif parser_type == "cnn_date":
-            return DateParser._parse_cnn_date(date_string)
-        elif parser_type == "bbc_date":
-            return DateParser._parse_bbc_date(date_string)
-        elif parser_type == "relative":
-            return DateParser._parse_relative_time(date_string)
-        else:
-            # 自动检测格式
-            return DateParser._auto_parse(date_string)
+def _parse_iso8601(date_string: str) -> Optional[datetime]:
+    """
+    解析ISO 8601格式
 
-    @staticmethod
-    def _parse_iso8601(date_string: str) -> Optional[datetime]:
-        """
-        解析ISO 8601格式
+    支持格式:
+        - 2024-12-21T10:30:00Z
+        - 2024-12-21T10:30:00+08:00
+        - 2024-12-21T10:30:00.123456Z
+    """
+    try:
+        # 移除末尾的Z并替换为+00:00
+        if date_string.endswith("Z"):
+            date_string = date_string[:-1] + "+00:00"
+
+        return datetime.fromisoformat(date_string)
+    except Exception as e:
+        logger.debug(f"ISO8601解析失败: {date_string}, {e}")
+        return None
 
-        支持格式:
-            - 2024-12-21T10:30:00Z
-            - 2024-12-21T10:30:00+08:00
-            - 2024-12-21T10:30:00.123456Z
-        """
-        try:
-            # 移除末尾的Z并替换为+00:00
-            if date_string.endswith("Z"):
-                date_string = date_string[:-1] + "+00:00"
 
-            return datetime.fromisoformat(date_string)
-        except Exception as e:
-            logger.debug(f"ISO8601解析失败: {date_string}, {e}")
-            return None
+def _parse_cnn_date(
+    date_string: str, _M=MONTH_MAPPING, _RE=_CNN_RE
+) -> Optional[datetime]:
+    """
+    解析CNN特有格式
 
-    @staticmethod
-    def _parse_cnn_date(date_string: str) -> Optional[datetime]:
-        """
-        解析CNN特有格式
+    支持格式:
+        - Updated 10:30 AM EST, Thu December 21, 2024
+        - Published 3:45 PM GMT, Monday, December 21, 2024
+    """
+    try:
+        # 提取时间和日期部分
+        match = _RE.search(date_string)
+
+        if match:
+            hour, minute, ampm, month_name, day, year = match.groups()
+
+            # 转换12小时制到24小时制
+            hour = int(hour)
+            if ampm.upper() == "PM" and hour != 12:
+                hour += 12
+            elif ampm.upper() == "AM" and hour == 12:
+                hour = 0
+
+            # 获取月份数字
+            month = _M.get(month_name.lower())
+            if not month:
+                logger.warning(f"未识别的月份: {month_name}")
+                return None
+
+            return datetime(
+                year=int(year),
+                month=month,
+                day=int(day),
+                hour=hour,
+                minute=int(minute),
+            )
+    except Exception as e:
+        logger.debug(f"CNN日期解析失败: {date_string}, {e}")
+
+    return None
+
+
+def _parse_bbc_date(
+    date_string: str, _M=MONTH_MAPPING, _DMY=_BBC_DMY_RE, _MDY=_BBC_MDY_RE
+) -> Optional[datetime]:
+    """
+    解析BBC特有格式
 
-        支持格式:
-            - Updated 10:30 AM EST, Thu December 21, 2024
-            - Published 3:45 PM GMT, Monday, December 21, 2024
-        """
-        try:
-            # 提取时间和日期部分
-            pattern = r"(\d{1,2}):(\d{2})\s*(AM|PM)\s*\w+,\s*(?:\w+,?\s+)?(\w+)\s+(\d{1,2}),\s+(\d{4})"
-            match = re.search(pattern, date_string, re.IGNORECASE)
-
-            if match:
-                hour, minute, ampm, month_name, day, year = match.groups()
-
-                # 转换12小时制到24小时制
-                hour = int(hour)
-                if ampm.upper() == "PM" and hour != 12:
-                    hour += 12
-                elif ampm.upper() == "AM" and hour == 12:
-                    hour = 0
-
-                # 获取月份数字
-                month = DateParser.MONTH_MAPPING.get(month_name.lower())
-                if not month:
-                    logger.warning(f"未识别的月份: {month_name}")
-                    return None
-
-                return datetime(
-                    year=int(year),
-                    month=month,
-                    day=int(day),
-                    hour=hour,
-                    minute=int(minute),
-                )
-        except Exception as e:
-            logger.debug(f"CNN日期解析失败: {date_string}, {e}")
+    支持格式:
+        - 21 December 2024
+        - 3 hours ago
+        - December 21, 2024
+    """
+    # 先尝试相对时间
+    relative_time = _parse_relative_time(date_string)
+    if relative_time:
+        return relative_time
 
-        return None
+    try:
+        # 解析绝对时间: DD Month YYYY 或 Month DD, YYYY
 
-    @staticmethod
-    def _parse_bbc_date(date_string: str) -> Optional[datetime]:
-        """
-        解析BBC特有格式
+        # 格式1: 21 December 2024
+        match = _DMY.search(date_string)
 
-        支持格式:
-            - 21 December 2024
-            - 3 hours ago
-            - December 21, 2024
-        """
-        # 先尝试相对时间
-        relative_time = DateParser._parse_relative_time(date_string)
-        if relative_time:
-            return relative_time
+        if match:
+            day, month_name, year = match.groups()
+            month = _M.get(month_name.lower())
 
-        try:
-            # 解析绝对时间: DD Month YYYY 或 Month DD, YYYY
+            if month:
+                return datetime(year=int(year), month=month, day=int(day))
 
-            # 格式1: 21 December 2024
-            pattern1 = r"(\d{1,2})\s+(\w+)\s+(\d{4})"
-            match = re.search(pattern1, date_string)
+        # 格式2: December 21, 2024
+        match = _MDY.search(date_string)
 
-            if match:
-                day, month_name, year = match.groups()
-                month = DateParser.MONTH_MAPPING.get(month_name.lower())
+        if match:
+            month_name, day, year = match.groups()
+            month = _M.get(month_name.lower())
 
-                if month:
-                    return datetime(year=int(year), month=month, day=int(day))
+            if month:
+                return datetime(year=int(year), month=month, day=int(day))
+    except Exception as e:
+        logger.debug(f"BBC日期解析失败: {date_string}, {e}")
 
-            # 格式2: December 21, 2024
-            pattern2 = r"(\w+)\s+(\d{1,2}),?\s+(\d{4})"
-            match = re.search(pattern2, date_string)
+    return None
 
-            if match:
-                month_name, day, year = match.groups()
-                month = DateParser.MONTH_MAPPING.get(month_name.lower())
 
-                if month:
-                    return datetime(year=int(year), month=month, day=int(day))
-        except Exception as e:
-            logger.debug(f"BBC日期解析失败: {date_string}, {e}")
+def _parse_relative_time(date_string: str) -> Optional[datetime]:
+    """
+    解析相对时间
 
+    支持格式:
+        - 5 minutes ago
+        - 2 hours ago
+        - yesterday
+        - just now
+    """
+    minutes = _relative_minutes(date_string)
+    if minutes is None:
         return None
+    return _now() - timedelta(minutes=minutes)
 
-    @staticmethod
-    def _parse_relative_time(date_string: str) -> Optional[datetime]:
-        """
-        解析相对时间
 
-        支持格式:
-            - 5 minutes ago
-            - 2 hours ago
-            - yesterday
-            - just now
-        """
-        date_lower = date_string.lower()
-
-        # 检查固定模式
-        for pattern, value in DateParser.RELATIVE_PATTERNS.items():
-            if pattern in date_lower:
-                if isinstance(value, int):
-                    # 固定分钟数
-                    return datetime.now() - timedelta(minutes=value)
-                else:
-                    # 需要提取数字
-                    numbers = re.findall(r"\d+", date_string)
-                    if numbers:
-                        num = int(numbers[0])
-
-                        if value == "minutes":
-                            return datetime.now() - timedelta(minutes=num)
-                        elif value == "hours":
-                            return datetime.now() - timedelta(hours=num)
-                        elif value == "days":
-                            return datetime.now() - timedelta(days=num)
-                        elif value == "weeks":
-                            return datetime.now() - timedelta(weeks=num)
-                        elif value == "months":
-                            # 近似计算，1个月=30天
-                            return datetime.now() - timedelta(days=num * 30)
-                        elif value == "years":
-                            # 近似计算，1年=365天
-                            return datetime.now() - timedelta(days=num * 365)
+def _relative_minutes(
+    date_string: str,
+    _RE=_REL_RE,
+    _FIXED=_REL_FIXED_MINUTES,
+    _UNIT=_REL_UNIT,
+    _UNIT_MINUTES=_REL_UNIT_MINUTES,
+    _DIGITS=_DIGITS_RE,
+) -> Optional[int]:
+    """
+    解析相对时间距当前的分钟数
+
+    Args:
+        date_string: 日期字符串
 
+    Returns:
+        分钟数，不是相对时间时返回None
+    """
+    # 一次正则扫描找到相对时间关键词
+    match = _RE.search(date_string.lower())
+    if not match:
         return None
+    key = match.group()
 
-    @staticmethod
-    def _parse_common_formats(date_string: str) -> Optional[datetime]:
-        """
-        尝试常见日期格式
-
-        支持格式:
-            - 2024-12-21 10:30:00
-            - 2024-12-21
-            - 21/12/2024
-            - 12/21/2024
-            - December 21, 2024
-        """
-        common_formats = [
-            "%Y-%m-%d %H:%M:%S",  # 2024-12-21 10:30:00
-            "%Y-%m-%d",  # 2024-12-21
-            "%d/%m/%Y",  # 21/12/2024
-            "%m/%d/%Y",  # 12/21/2024 (美式)
-            "%d-%m-%Y",  # 21-12-2024
-            "%Y/%m/%d",  # 2024/12/21
-            "%B %d, %Y",  # December 21, 2024
-            "%b %d, %Y",  # Dec 21, 2024
-            "%d %B %Y",  # 21 December 2024
-            "%d %b %Y",  # 21 Dec 2024
-            "%Y-%m-%d %H:%M:%S.%f",  # 2024-12-21 10:30:00.123456
-        ]
-
-        for fmt in common_formats:
-            try:
-                return datetime.strptime(date_string, fmt)
-            except:
-                continue
+    # 固定分钟数
+    minutes = _FIXED.get(key)
+    if minutes is not None:
+        return minutes
 
+    # 需要提取数字
+    number = _DIGITS.search(date_string)
+    if not number:
         return None
+    num = int(number.group())
+
+    factor = _UNIT_MINUTES.get(_UNIT[key])
+    return num * factor if factor else None
+
+
+def _parse_common_formats(
+    date_string: str,
+    _M=MONTH_MAPPING,
+    _YMD=_YMD_RE,
+    _YMD_SLASH=_YMD_SLASH_RE,
+    _DMY=_DMY_RE,
+    _DMY_TEXT=_DMY_TEXT_RE,
+    _MDY_TEXT=_MDY_TEXT_RE,
+) -> Optional[datetime]:
+    """
+    尝试常见日期格式
+
+    支持格式:
+        - 2024-12-21 10:30:00
+        - 2024-12-21
+        - 21/12/2024
+        - 12/21/2024
+        - December 21, 2024
+    """
+    if date_string[:1].isdigit():
+        # 2024-12-21 / 2024-12-21 10:30:00 / 2024-12-21 10:30:00.123456
+        match = _YMD.match(date_string)
+        if match:
+            year, month, day, hour, minute, second, fraction = match.groups()
+            return _build_datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour or 0),
+                int(minute or 0),
+                int(second or 0),
+                int(fraction.ljust(6, "0")) if fraction else 0,
+            )
+
+        # 2024/12/21
+        match = _YMD_SLASH.match(date_string)
+        if match:
+            year, month, day = match.groups()
+            return _build_datetime(int(year), int(month), int(day))
+
+        # 21/12/2024 或 12/21/2024（日在前优先，失败再按美式解析）；21-12-2024
+        match = _DMY.match(date_string)
+        if match:
+            first, sep, second, year = match.groups()
+            result = _build_datetime(int(year), int(second), int(first))
+            if result is None and sep == "/":
+                result = _build_datetime(int(year), int(first), int(second))
+            return result
+
+        # 21 December 2024 / 21 Dec 2024
+        match = _DMY_TEXT.match(date_string)
+        if match:
+            day, month_name, year = match.groups()
+            month = _M.get(month_name.lower())
+            if month:
+                return _build_datetime(int(year), month, int(day))
+        return None
+
+    # December 21, 2024 / Dec 21, 2024
+    match = _MDY_TEXT.match(date_string)
+    if match:
+        month_name, day, year = match.groups()
+        month = _M.get(month_name.lower())
+        if month:
+            return _build_datetime(int(year), month, int(day))
+
+    return None
+
+
+def _auto_parse(date_string: str) -> Optional[datetime]:
+    """
+    自动检测并解析日期格式
+    按优先级尝试各种格式
+
+    Args:
+        date_string: 日期字符串
+
+    Returns:
+        datetime对象或None
+    """
+    # 根据字符串特征直接选择最可能的解析器，避免逐个尝试
+    low = date_string.lower()
+    candidates: Tuple[Callable[..., Optional[datetime]], ...]
+    if " ago" in low or low in ("yesterday", "just now"):
+        candidates = (_parse_relative_time,)
+    elif date_string[:1].isdigit():
+        if "T" in date_string or date_string.endswith("Z"):
+            candidates = (_parse_iso8601,)
+        else:
+            candidates = (_parse_common_formats, _parse_bbc_date)
+    else:
+        candidates = (_parse_cnn_date, _parse_bbc_date)
+
+    result = _try_parsers(date_string, candidates)
+    if result:
+        return result
+
+    # 未命中时按优先级尝试其余解析器
+    parsers = (
+        _parse_iso8601,  # ISO标准格式（最常见）
+        _parse_relative_time,  # 相对时间
+        _parse_common_formats,  # 常见格式
+        _parse_cnn_date,  # 特定网站格式
+        _parse_bbc_date,  # 特定网站格式
+    )
+    result = _try_parsers(date_string, [p for p in parsers if p not in candidates])
+    if result:
+        return result
+
+    logger.warning(f"无法解析日期: {date_string}")
+    return None
+
+
+def _try_parsers(date_string: str, parsers) -> Optional[datetime]:
+    """
+    依次尝试解析器，返回第一个成功的结果
+
+    Args:
+        date_string: 日期字符串
+        parsers: 解析器序列
+
+    Returns:
+        datetime对象或None
+    """
+    for parser in parsers:
+        try:
+            result = parser(date_string)
+            if result:
+                logger.debug(f"成功解析日期: {date_string} -> {result}")
+                return result
+        except Exception as e:
+            logger.debug(f"解析器 {parser.__name__} 失败: {e}")
+            continue
+
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_to_offset(date_string: str, parser_type: str) -> Tuple[str, Any]:
+    """
+    解析日期字符串，结果按(date_string, parser_type)缓存
+
+    Args:
+        date_string: 已去除首尾空白的日期字符串
+        parser_type: 解析器类型
+
+    Returns:
+        ("rel_minutes", 分钟数) 或 ("abs", datetime对象或None)
+    """
+    # 相对时间关键词不会出现在ISO格式中，auto模式下先判断相对时间与原优先级一致
+    if parser_type not in ("iso8601", "cnn_date"):
+        minutes = _relative_minutes(date_string)
+        if minutes is not None:
+            return "rel_minutes", minutes
+        if parser_type == "relative":
+            return "abs", None
+
+    # 根据类型选择解析器
+    if parser_type == "iso8601":
+        return "abs", _parse_iso8601(date_string)
+    elif parser_type == "cnn_date":
+        return "abs", _parse_cnn_date(date_string)
+    elif parser_type == "bbc_date":
+        return "abs", _parse_bbc_date(date_string)
+    else:
+        # 自动检测格式
+        return "abs", _auto_parse(date_string)
+
+
+class DateParser:
+    """
+    多格式日期解析器
+    自动识别并解析各种日期时间格式
+
+    解析逻辑位于模块级函数中，此类仅保留原有接口并委托调用
+    """
+
+    __slots__ = ()
+
+    RELATIVE_PATTERNS = RELATIVE_PATTERNS
+    MONTH_MAPPING = MONTH_MAPPING
 
     @staticmethod
-    def _auto_parse(date_string: str) -> Optional[datetime]:
+    def parse(date_string: str, parser_type: str = "auto") -> Optional[datetime]:
         """
-        自动检测并解析日期格式
-        按优先级尝试各种格式
+        统一的日期解析入口
 
         Args:
             date_string: 日期字符串
+            parser_type: 解析器类型
+                - auto: 自动检测（默认）
+                - iso8601: ISO 8601格式
+                - cnn_date: CNN特定格式
+                - bbc_date: BBC特定格式
+                - relative: 相对时间
 
         Returns:
-            datetime对象或None
+            datetime对象，失败返回None
+
+        Examples:
+            >>> DateParser.parse('2024-12-21T10:30:00Z')
+            datetime(2024, 12, 21, 10, 30, 0)
+
+            >>> DateParser.parse('5 minutes ago')
+            datetime(2024, 12, 21, 10, 25, 0)  # 相对于当前时间
         """
-        # 解析器优先级列表
-        parsers = [
-            DateParser._parse_iso8601,  # ISO标准格式（最常见）
-            DateParser._parse_relative_time,  # 相对时间
-            DateParser._parse_common_formats,  # 常见格式
-            DateParser._parse_cnn_date,  # 特定网站格式
-            DateParser._parse_bbc_date,  # 特定网站格式
-        ]
-
-        for parser in parsers:
-            try:
-                result = parser(date_string)
-                if result:
-                    logger.debug(f"成功解析日期: {date_string} -> {result}")
-                    return result
-            except Exception as e:
-                logger.debug(f"解析器 {parser.__name__} 失败: {e}")
-                continue
-
-        logger.warning(f"无法解析日期: {date_string}")
-        return None
+        return _parse(date_string, parser_type)
+
+    _parse_iso8601 = staticmethod(_parse_iso8601)
+    _parse_cnn_date = staticmethod(_parse_cnn_date)
+    _parse_bbc_date = staticmethod(_parse_bbc_date)
+    _parse_relative_time = staticmethod(_parse_relative_time)
+    _relative_minutes = staticmethod(_relative_minutes)
+    _parse_common_formats = staticmethod(_parse_common_formats)
+    _auto_parse = staticmethod(_auto_parse)
+    _try_parsers = staticmethod(_try_parsers)
 
 
 def parse_date(date_string: str, parser_type: str = "auto") -> Optional[datetime]:
@@ -345,7 +565,7 @@ def parse_date(date_string: str, parser_type: str = "auto") -> Optional[datetime
         >>> parse_date('5 hours ago')
         datetime(...)  # 5小时前的时间
     """
-    return DateParser.parse(date_string, parser_type)
+    return _parse(date_string, parser_type)
 
 
 if __name__ == "__main__":
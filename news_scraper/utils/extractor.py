@@ -6,9 +6,251 @@
 import re
 import json
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from pathlib import Path
-from scrapy.http import Response
+from cssselect import SelectorError
+from lxml import etree  # type: ignore[import-untyped]
+from parsel import Selector
+from parsel.csstranslator import HTMLTranslator
+from scrapy.http import TextResponse
+
+# 导入日期解析器
+try:
+    from news_scraper.utils.date_parser import parse_date
+except ImportError:
+    # 如果在开发环境
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent))
+    try:
+        from date_parser import parse_date  # type: ignore[import-not-found,no-redef]
+    except ImportError:
+        parse_date = None  # type: ignore[assignment]
+
+try:
+    import ahocorasick  # type: ignore[import-not-found,import-untyped]
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2  # type: ignore[import-not-found,import-untyped]
+except ImportError:
+    re2 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# 与parsel一致的XPath命名空间（支持re:test、set:distinct等EXSLT函数）
+_XPATH_NAMESPACES: Dict[str, str] = dict(Selector._default_namespaces)
+
+# 无效图片URL关键词（图标、logo、占位图等）
+_INVALID_IMG_RE = re.compile(
+    r"icon|logo|placeholder|avatar|sprite|blank|spacer|pixel", re.IGNORECASE
+)
+# 有效的图片URL格式: http://、https:// 或 //
+_VALID_SCHEME_RE = re.compile(r"^(https?:)?//")
+
+# CSS到XPath的转换器（与parsel的Selector.css保持一致，编译结果由_SELECTOR_CACHE缓存）
+_css_to_xpath = HTMLTranslator().css_to_xpath
+
+# 选择器编译阶段可能出现的错误（CSS语法错误、XPath语法或求值错误）
+_SELECTOR_ERRORS = (SelectorError, etree.XPathError)
+
+# 已编译的选择器，按(选择器类型, 选择器)缓存，
+# 不同字段、不同新闻源之间相同的选择器只编译一次
+_SELECTOR_CACHE: Dict[Tuple[str, str], etree.XPath] = {}
+
+# 用于试运行XPath的空文档
+_PROBE_DOC = etree.fromstring("<html/>")
+
+# 启用线程池时，字段数不少于该值才并行提取
+_PARALLEL_MIN_FIELDS = 4
+
+
+def _resolve_selectors(field_config: Dict[str, Any]) -> Tuple[str, List[str]]:
+    """
+    确定字段使用的选择器类型和选择器列表
+
+    Args:
+        field_config: 字段配置，包含css、xpath、priority等
+
+    Returns:
+        (选择器类型, 选择器列表)，没有配置选择器时列表为空
+    """
+    priority = field_config.get("priority", "css")
+    selectors = field_config.get(priority, [])
+
+    # 如果优先选择器没有配置，使用另一种
+    if not selectors:
+        priority = "xpath" if priority == "css" else "css"
+        selectors = field_config.get(priority, [])
+
+    # 确保selectors是列表
+    if isinstance(selectors, str):
+        selectors = [selectors]
+
+    return priority, list(selectors)
+
+
+def _node_to_text(node: Any) -> str:
+    """
+    将XPath结果节点转换为字符串，元素节点序列化为HTML
+    """
+    if isinstance(node, str):
+        return str(node)
+    if isinstance(node, bool):
+        return "1" if node else "0"
+    if isinstance(node, float):
+        return str(node)
+    return etree.tostring(node, encoding="unicode", method="html", with_tail=False)
+
+
+def _compile_xpath(selector: str, priority: str) -> etree.XPath:
+    """
+    将CSS或XPath选择器编译为lxml的XPath对象，相同的选择器复用已编译的对象
+
+    Args:
+        selector: 选择器字符串
+        priority: 选择器类型，css或xpath
+
+    Returns:
+        编译后的XPath对象
+
+    Raises:
+        SelectorError: CSS选择器语法错误
+        etree.XPathError: XPath语法错误，或试运行时出现求值错误（如未定义的函数）
+    """
+    key = (priority, selector)
+    compiled = _SELECTOR_CACHE.get(key)
+    if compiled is not None:
+        return compiled
+
+    xpath = _css_to_xpath(selector) if priority == "css" else selector
+    compiled = etree.XPath(xpath, namespaces=_XPATH_NAMESPACES, smart_strings=False)
+    # 在空文档上试运行一次，提前发现只有求值时才会报告的错误
+    compiled(_PROBE_DOC)
+    _SELECTOR_CACHE[key] = compiled
+    return compiled
+
+
+def _xpath_iter(xpath: etree.XPath, root: Any) -> Iterator[str]:
+    """
+    在lxml文档上执行编译后的XPath，按需逐个转换结果节点
+
+    Args:
+        xpath: 编译后的XPath对象
+        root: lxml文档根节点
+
+    Returns:
+        字符串迭代器
+    """
+    result = xpath(root)
+    if not isinstance(result, list):
+        result = [result]
+    return map(_node_to_text, result)
+
+
+def _xpath_getall(xpath: etree.XPath, root: Any) -> List[str]:
+    """
+    在lxml文档上执行编译后的XPath，结果与parsel的getall()一致
+
+    Args:
+        xpath: 编译后的XPath对象
+        root: lxml文档根节点
+
+    Returns:
+        字符串列表
+    """
+    return list(_xpath_iter(xpath, root))
+
+
+def _is_multi(field_config: Dict[str, Any]) -> bool:
+    """
+    判断字段是否需要全部匹配结果
+    配置了join或multi为true的字段保留所有结果，其余字段只取第一个有效值
+    """
+    return field_config.get("multi", "join" in field_config)
+
+
+def _filter_valid_image(data: Iterable[str]) -> Iterable[str]:
+    """过滤无效图片URL"""
+    return (
+        url
+        for url in data
+        if len(url) > 20  # 排除过短的URL
+        and _VALID_SCHEME_RE.match(url)  # 有效的URL格式
+        and not _INVALID_IMG_RE.search(url)
+    )
+
+
+def _filter_remove_empty(data: Iterable[str]) -> Iterable[str]:
+    """移除空字符串"""
+    return (item for item in data if item and item.strip())
+
+
+def _filter_unique(data: Iterable[str]) -> List[str]:
+    """去重，保持顺序（dict保持插入顺序）"""
+    return list(dict.fromkeys(data))
+
+
+# 过滤器名称到过滤函数的映射
+_FILTERS: Dict[str, Callable[[Iterable[str]], Iterable[str]]] = {
+    "valid_image": _filter_valid_image,
+    "remove_empty": _filter_remove_empty,
+    "unique": _filter_unique,
+}
+
+
+def _identity(data: Any) -> Any:
+    """原样返回数据"""
+    return data
+
+
+# 日期解析器类型（名称中包含date的解析器也按日期解析）
+_DATE_PARSER_TYPES = frozenset({"auto", "iso8601", "cnn_date", "bbc_date"})
+
+
+def compile_selector(
+    field_config: Dict[str, Any],
+) -> Callable[[TextResponse], List[str]]:
+    """
+    预编译字段的选择器，返回直接在lxml文档上执行的提取函数
+    CSS选择器预先转换为XPath，所有XPath预先编译，避免每个页面重复解析
+
+    Args:
+        field_config: 字段配置，包含css、xpath、priority等
+
+    Returns:
+        提取函数，接收Response，返回第一个有结果的选择器提取到的非空字符串列表
+    """
+    priority, selectors = _resolve_selectors(field_config)
+
+    compiled = []
+    for selector in selectors:
+        try:
+            compiled.append(_compile_xpath(selector, priority))
+        except _SELECTOR_ERRORS as e:
+            logger.error(f"✗ 选择器编译失败: {selector[:50]}, 错误: {e}")
+
+    def extract(response: TextResponse) -> List[str]:
+        root = response.selector.root
+        for xpath in compiled:
+            values = [
+                text
+                for text in (node.strip() for node in _xpath_getall(xpath, root))
+                if text
+            ]
+            if values:
+                return values
+        return []
+
+    return extract
 
 
 class DataExtractor:
@@ -29,9 +271,105 @@ class DataExtractor:
         self.logger = logging.getLogger(
             f'{self.__class__.__name__}.{config.get("name", "unknown")}'
         )
+        # 预编译各字段的选择器，避免每个页面重复转换和编译
+        # 必填字段排在前面，配合fast_fail尽早放弃无效页面
+        self._selectors_config = config.get("selectors", {})
+        self._required_fields = frozenset(
+            field_name
+            for field_name, field_config in self._selectors_config.items()
+            if field_config.get("required", False)
+        )
+        # 开启后任一必填字段提取失败即停止提取其余字段
+        self._fast_fail = bool(config.get("fast_fail", False))
+        # 字段并行提取使用的线程池，由MultiSiteExtractor设置，为None时串行提取
+        self.executor: Optional[ThreadPoolExecutor] = None
+        # 按字段配置特化的提取函数，接收lxml文档根节点，返回提取结果
+        self._field_fns = {
+            field_name: self._build_field_fn(
+                field_name,
+                field_config,
+                self._compile_field(field_name, field_config),
+                _is_multi(field_config),
+            )
+            for field_name, field_config in sorted(
+                self._selectors_config.items(),
+                key=lambda entry: not entry[1].get("required", False),
+            )
+        }
+
+        # 预编译文章URL正则，排除模式统一转为小写
+        url_patterns = config.get("url_patterns", {})
+        self._article_re: Optional[Any] = None
+        article_pattern = url_patterns.get("article")
+        if article_pattern:
+            try:
+                self._article_re = self._compile_article_re(article_pattern)
+            except re.error as e:
+                self.logger.error(f"article正则编译失败: {article_pattern}, 错误: {e}")
+                # 正则无效时不接受任何URL
+                self._article_re = re.compile(r"(?!)")
+        self._exclude_patterns = tuple(
+            p.lower() for p in url_patterns.get("exclude", [])
+        )
+        # 安装了pyahocorasick时，用AC自动机一次扫描匹配所有排除模式
+        # （含空字符串的模式无法加入自动机，仍使用逐个匹配）
+        self._exclude_ac: Optional[Any] = None
+        patterns = self._exclude_patterns
+        if ahocorasick is not None and patterns and all(patterns):
+            automaton = ahocorasick.Automaton()
+            for pattern in patterns:
+                automaton.add_word(pattern, pattern)
+            automaton.make_automaton()
+            self._exclude_ac = automaton
+        # 按实例缓存URL校验结果，分页列表中重复出现的链接无需再次匹配
+        self._url_check = lru_cache(maxsize=4096)(self._check_article_url)
+
+    def _compile_article_re(self, pattern: str) -> Any:
+        """
+        编译文章URL正则
+        安装了google-re2时优先使用线性时间的RE2引擎，
+        RE2不支持的语法（如环视、反向引用）退回标准re模块
+
+        Args:
+            pattern: 正则表达式字符串
+
+        Returns:
+            编译后的正则对象
+        """
+        if re2 is not None:
+            try:
+                return re2.compile(pattern)
+            except re2.error:
+                self.logger.debug(f"RE2不支持该正则，使用re模块: {pattern}")
+        return re.compile(pattern)
+
+    def _compile_field(
+        self, field_name: str, field_config: Dict[str, Any]
+    ) -> List[Tuple[str, etree.XPath]]:
+        """
+        编译字段配置中的所有选择器
+
+        Args:
+            field_name: 字段名称
+            field_config: 字段配置，包含css、xpath、priority等
+
+        Returns:
+            (原始选择器, 编译后的XPath)列表，编译失败的选择器被跳过
+        """
+        priority, selectors = _resolve_selectors(field_config)
+
+        compiled = []
+        for i, selector in enumerate(selectors, 1):
+            try:
+                compiled.append((selector, _compile_xpath(selector, priority)))
+            except _SELECTOR_ERRORS as e:
+                self.logger.error(
+                    f"✗ 字段 {field_name} 选择器#{i} 编译失败: {selector[:50]}, 错误: {e}"
+                )
+        return compiled
 
     def extract_field(
-        self, response: Response, field_name: str, field_config: Dict[str, Any]
+        self, response: TextResponse, field_name: str, field_config: Dict[str, Any]
     ) -> Any:
         """
         提取单个字段数据，支持多选择器降级
@@ -53,61 +391,96 @@ class DataExtractor:
             >>> extractor.extract_field(response, 'title', field_config)
             'News Title'
         """
-        # 确定使用CSS还是XPath
-        priority = field_config.get("priority", "css")
-        selectors = field_config.get(priority, [])
+        # 使用预编译的提取函数，传入的配置不是初始化时的配置则临时构建
+        if field_config is self._selectors_config.get(field_name):
+            extract = self._field_fns[field_name]
+        else:
+            extract = self._build_field_fn(
+                field_name,
+                field_config,
+                self._compile_field(field_name, field_config),
+                _is_multi(field_config),
+            )
+
+        return extract(response.selector.root)
+
+    def _build_field_fn(
+        self,
+        field_name: str,
+        field_config: Dict[str, Any],
+        compiled: List[Tuple[str, etree.XPath]],
+        multi: bool = True,
+    ) -> Callable[[Any], Any]:
+        """
+        根据字段配置构建特化的提取函数，支持多选择器降级
+        过滤器、解析器、合并方式等在构建时确定，提取时不再读取配置
 
-        # 如果优先选择器没有配置，使用另一种
-        if not selectors:
-            priority = "xpath" if priority == "css" else "css"
-            selectors = field_config.get(priority, [])
+        Args:
+            field_name: 字段名称
+            field_config: 字段配置
+            compiled: (原始选择器, 编译后的XPath)列表
+            multi: 是否需要全部结果，为False时只处理到第一个有效值为止
 
-        if not selectors:
-            self.logger.warning(f"字段 {field_name} 没有配置选择器")
-            return None
+        Returns:
+            提取函数，接收lxml文档根节点，返回提取到的数据，失败返回None
+        """
+        logger = self.logger
 
-        # 确保selectors是列表
-        if isinstance(selectors, str):
-            selectors = [selectors]
+        if not compiled:
 
-        # 依次尝试每个选择器（降级机制）
-        for i, selector in enumerate(selectors, 1):
-            try:
-                if priority == "css":
-                    result = response.css(selector).getall()
-                else:
-                    result = response.xpath(selector).getall()
+            def extract_missing(root: Any) -> Any:
+                logger.warning(f"字段 {field_name} 没有配置选择器")
+                return None
 
-                # 如果提取到数据
-                if result:
-                    # 处理结果
-                    result = self._process_result(result, field_config, field_name)
+            return extract_missing
+
+        process = self._make_processor(field_config, field_name)
+        required = field_config.get("required", False)
+
+        def extract(root: Any) -> Any:
+            # 依次尝试每个选择器（降级机制）
+            for i, (selector, xpath) in enumerate(compiled, 1):
+                result: Any = None
+                try:
+                    if multi:
+                        result = _xpath_getall(xpath, root)
+                        if result:
+                            # 处理结果
+                            result = process(result)
+                    else:
+                        # 单值字段逐个处理匹配结果，得到第一个有效值即停止
+                        for text in _xpath_iter(xpath, root):
+                            result = process([text])
+                            if result:
+                                break
 
                     if result:
-                        self.logger.debug(
+                        logger.debug(
                             f"✓ 字段 {field_name} 使用选择器#{i} 提取成功: {selector[:50]}"
                         )
                         return result
-                else:
-                    self.logger.debug(f"✗ 选择器#{i} 未提取到数据: {selector[:50]}")
+                    logger.debug(f"✗ 选择器#{i} 未提取到数据: {selector[:50]}")
 
-            except Exception as e:
-                self.logger.error(f"✗ 选择器#{i} 执行失败: {selector[:50]}, 错误: {e}")
-                continue
+                except (AttributeError, TypeError, etree.XPathEvalError) as e:
+                    # 选择器已在编译时校验，这里只处理文档结构异常等运行时问题
+                    logger.error(f"✗ 选择器#{i} 执行失败: {selector[:50]}, 错误: {e}")
+                    continue
 
-        # 所有选择器都失败
-        if field_config.get("required", False):
-            self.logger.error(f"❌ 必填字段 {field_name} 提取失败")
-        else:
-            self.logger.debug(f"⚠ 可选字段 {field_name} 提取失败")
+            # 所有选择器都失败
+            if required:
+                logger.error(f"❌ 必填字段 {field_name} 提取失败")
+            else:
+                logger.debug(f"⚠ 可选字段 {field_name} 提取失败")
 
-        return None
+            return None
 
-    def _process_result(
-        self, result: List[str], config: Dict[str, Any], field_name: str
-    ) -> Any:
+        return extract
+
+    def _make_processor(
+        self, config: Dict[str, Any], field_name: str
+    ) -> Callable[[List[str]], Any]:
         """
-        处理提取结果
+        根据字段配置组合结果处理函数
 
         处理步骤:
         1. 清理空白
@@ -116,57 +489,63 @@ class DataExtractor:
         4. 合并或取第一个
 
         Args:
-            result: 提取到的原始数据列表
             config: 字段配置
             field_name: 字段名称
 
         Returns:
-            处理后的数据
+            处理函数，接收提取到的原始数据列表，返回处理后的数据
         """
-        if not result:
-            return None
-
-        # 清理数据 - 移除空白
-        result = [item.strip() for item in result if item and item.strip()]
-
-        if not result:
-            return None
+        stages = []
 
         # 应用过滤器
         filter_name = config.get("filter")
         if filter_name:
-            result = self._apply_filter(result, filter_name, field_name)
-
-        if not result:
-            return None
+            stages.append(self._resolve_filter(filter_name))
 
         # 应用解析器（用于日期等特殊格式）
         parser_name = config.get("parser")
-        if parser_name and result:
-            parsed_result = []
-            for item in result:
-                parsed = self._apply_parser(item, parser_name)
-                if parsed:
-                    parsed_result.append(parsed)
-            result = parsed_result
-
-        if not result:
-            return None
+        if parser_name:
+            parser = self._resolve_parser(parser_name)
+            if parser is not _identity:
+                stages.append(
+                    lambda items: (
+                        parsed for parsed in (parser(item) for item in items) if parsed
+                    )
+                )
 
         # 合并或取第一个
         join_str = config.get("join")
-        if join_str is not None:
-            # 合并所有结果
-            return join_str.join(str(item) for item in result if item)
-        else:
+
+        def process(result: List[str]) -> Any:
+            if not result:
+                return None
+
+            # 清理、过滤、解析串联为生成器，每个元素只遍历一次，不生成中间列表
+            # 清理数据 - 移除空白
+            items: Iterable[str] = (
+                text for text in (item.strip() for item in result if item) if text
+            )
+            for stage in stages:
+                items = stage(items)
+
+            if join_str is not None:
+                # 合并所有结果
+                joined = [str(item) for item in items]
+                return join_str.join(joined) if joined else None
+
+            values = list(items)
+            if not values:
+                return None
             # 返回第一个或整个列表
-            return result[0] if len(result) == 1 else result
+            return values[0] if len(values) == 1 else values
+
+        return process
 
-    def _apply_filter(
-        self, data: List[str], filter_name: str, field_name: str
-    ) -> List[str]:
+    def _resolve_filter(
+        self, filter_name: str
+    ) -> Callable[[Iterable[str]], Iterable[str]]:
         """
-        数据过滤
+        根据名称查找过滤函数
 
         支持的过滤器:
         - valid_image: 过滤无效图片URL
@@ -174,91 +553,67 @@ class DataExtractor:
         - unique: 去重
 
         Args:
-            data: 待过滤数据
             filter_name: 过滤器名称
-            field_name: 字段名称
 
         Returns:
-            过滤后的数据
-        """
-        if filter_name == "valid_image":
-            # 过滤无效图片
-            invalid_patterns = [
-                "icon",
-                "logo",
-                "placeholder",
-                "avatar",
-                "sprite",
-                "blank",
-                "spacer",
-                "pixel",
-            ]
-            filtered = [
-                url
-                for url in data
-                if not any(p in url.lower() for p in invalid_patterns)
-                and len(url) > 20  # 排除过短的URL
-                and url.startswith(("http://", "https://", "//"))  # 有效的URL格式
-            ]
-            self.logger.debug(f"图片过滤: {len(data)} -> {len(filtered)}")
+            过滤函数，未知过滤器返回原样输出的函数
+        """
+        filter_fn = _FILTERS.get(filter_name)
+        if filter_fn is None:
+            self.logger.warning(f"未知过滤器: {filter_name}")
+            return _identity
+        if filter_name != "valid_image":
+            return filter_fn
+
+        logger = self.logger
+        image_filter = filter_fn
+
+        def filter_images(data: Iterable[str]) -> Iterable[str]:
+            # 调试模式下记录过滤前后的图片数量，否则保持惰性求值
+            if not logger.isEnabledFor(logging.DEBUG):
+                return image_filter(data)
+            data = list(data)
+            filtered = list(image_filter(data))
+            logger.debug(f"图片过滤: {len(data)} -> {len(filtered)}")
             return filtered
 
-        elif filter_name == "remove_empty":
-            # 移除空字符串
-            return [item for item in data if item and item.strip()]
+        return filter_images
 
-        elif filter_name == "unique":
-            # 去重，保持顺序
-            seen = set()
-            unique_data = []
-            for item in data:
-                if item not in seen:
-                    seen.add(item)
-                    unique_data.append(item)
-            return unique_data
-
-        else:
-            self.logger.warning(f"未知过滤器: {filter_name}")
-            return data
-
-    def _apply_parser(self, data: str, parser_name: str) -> Optional[str]:
+    def _resolve_parser(self, parser_name: str) -> Callable[[str], Optional[str]]:
         """
-        应用数据解析器
+        根据名称构建解析函数
 
         Args:
-            data: 待解析数据
             parser_name: 解析器名称
 
         Returns:
-            解析后的数据（ISO格式字符串）
+            解析函数，接收待解析数据，返回解析后的数据（日期为ISO格式字符串）
         """
-        # 导入日期解析器
-        try:
-            from news_scraper.utils.date_parser import parse_date
-        except ImportError:
-            # 如果在开发环境
-            import sys
-
-            sys.path.insert(0, str(Path(__file__).parent))
-            from date_parser import parse_date
-
-        if "date" in parser_name.lower() or parser_name in [
-            "auto",
-            "iso8601",
-            "cnn_date",
-            "bbc_date",
-        ]:
+        if not (parser_name in _DATE_PARSER_TYPES or "date" in parser_name.lower()):
+            return _identity
+
+        logger = self.logger
+        if parse_date is None:
+
+            def parse_unavailable(data: str) -> Optional[str]:
+                logger.error(f"日期解析器不可用，跳过解析: {parser_name}")
+                return data
+
+            return parse_unavailable
+
+        def parse_date_value(data: str) -> Optional[str]:
             try:
                 parsed_date = parse_date(data, parser_name)
                 if parsed_date:
                     return parsed_date.isoformat()
             except Exception as e:
-                self.logger.error(f"日期解析失败: {data}, 错误: {e}")
+                logger.error(f"日期解析失败: {data}, 错误: {e}")
                 return None
+            return data
 
-        return data
+        return parse_date_value
 
-    def extract_all_fields(self, response: Response) -> Dict[str, Any]:
+    def extract_all_fields(self, response: TextResponse) -> Optional[Dict[str, Any]]:
         """
         提取所有配置的字段
 
@@ -266,21 +621,67 @@ class DataExtractor:
             response: Scrapy Response对象
 
         Returns:
-            包含所有成功提取字段的字典
+            包含所有成功提取字段的字典；
+            配置了fast_fail且必填字段提取失败时返回None
         """
-        selectors_config = self.config.get("selectors", {})
+        root = response.selector.root
+        executor = self.executor
+        if executor is not None and len(self._field_fns) >= _PARALLEL_MIN_FIELDS:
+            return self._extract_parallel(root, executor)
+
+        required_fields = self._required_fields
+        fast_fail = self._fast_fail
         extracted_data = {}
 
-        for field_name, field_config in selectors_config.items():
-            data = self.extract_field(response, field_name, field_config)
+        for field_name, extract in self._field_fns.items():
+            data = extract(root)
             if data is not None:
                 extracted_data[field_name] = data
+            elif fast_fail and field_name in required_fields:
+                return None
+
+        return extracted_data
+
+    def _extract_parallel(
+        self, root: Any, executor: ThreadPoolExecutor
+    ) -> Optional[Dict[str, Any]]:
+        """
+        在线程池中并行提取所有字段，lxml执行XPath时会释放GIL，文档只读，可以在线程间共享
+        编译后的XPath对象由_SELECTOR_CACHE在字段和新闻源之间共用，lxml会串行执行同一个
+        XPath对象，因此使用相同选择器的字段之间并不会真正并行
+
+        Args:
+            root: lxml文档根节点
+            executor: 线程池
+
+        Returns:
+            与extract_all_fields相同
+        """
+        futures = [
+            (field_name, executor.submit(extract, root))
+            for field_name, extract in self._field_fns.items()
+        ]
+
+        required_fields = self._required_fields
+        fast_fail = self._fast_fail
+        extracted_data = {}
+
+        # 按计划顺序收集结果
+        for i, (field_name, future) in enumerate(futures):
+            data = future.result()
+            if data is not None:
+                extracted_data[field_name] = data
+            elif fast_fail and field_name in required_fields:
+                # 取消尚未开始的任务
+                for _, pending in futures[i + 1 :]:
+                    pending.cancel()
+                return None
 
         return extracted_data
 
     def is_valid_article_url(self, url: str) -> bool:
         """
-        检查URL是否为有效文章链接
+        检查URL是否为有效文章链接（结果按实例缓存）
 
         检查步骤:
         1. 匹配article正则模式
@@ -292,21 +693,36 @@ class DataExtractor:
         Returns:
             是否有效
         """
-        url_patterns = self.config.get("url_patterns", {})
+        return self._url_check(url)
 
+    def _check_article_url(self, url: str) -> bool:
+        """
+        检查URL是否为有效文章链接（不使用缓存）
+
+        Args:
+            url: 待检查的URL
+
+        Returns:
+            是否有效
+        """
         # 检查是否匹配文章URL模式
-        article_pattern = url_patterns.get("article")
-        if article_pattern:
-            if not re.search(article_pattern, url):
-                self.logger.debug(f"URL不匹配article模式: {url}")
-                return False
+        article_re = self._article_re
+        if article_re is not None and not article_re.search(url):
+            self.logger.debug(f"URL不匹配article模式: {url}")
+            return False
 
         # 检查排除模式
-        exclude_patterns = url_patterns.get("exclude", [])
-        for pattern in exclude_patterns:
-            if pattern in url.lower():
-                self.logger.debug(f'URL匹配排除模式 "{pattern}": {url}')
+        url_low = url.lower()
+        if self._exclude_ac is not None:
+            match = next(self._exclude_ac.iter(url_low), None)
+            if match is not None:
+                self.logger.debug(f'URL匹配排除模式 "{match[1]}": {url}')
                 return False
+        else:
+            for pattern in self._exclude_patterns:
+                if pattern in url_low:
+                    self.logger.debug(f'URL匹配排除模式 "{pattern}": {url}')
+                    return False
 
         return True
 
@@ -315,38 +731,120 @@ class MultiSiteExtractor:
     """
     多站点提取器管理器
     管理多个新闻源的配置和提取器实例
+
+    新闻源ID、配置和提取器按加载顺序存放在三个平行列表中，
+    通过source_id或域名到下标的索引一次查找定位
     """
 
-    def __init__(self, config_path: str = "config/news_sources.json"):
+    def __init__(
+        self, config_path: str = "config/news_sources.json", field_workers: int = 0
+    ):
         """
         初始化多站点提取器
 
         Args:
             config_path: 配置文件路径
+            field_workers: 字段并行提取的线程数，0表示串行提取
         """
         self.config_path = config_path
-        self.extractors = {}
-        self.configs = {}
+        # 所有提取器共享的字段提取线程池
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._source_ids: List[str] = []
+        self._configs: List[Dict[str, Any]] = []
+        self._extractors: List[DataExtractor] = []
+        self._config_hashes: List[int] = []
+        self._index: Dict[str, int] = {}
+        self._domain_to_idx: Dict[str, int] = {}
+        # 上次成功加载时配置文件的修改时间（纳秒）
+        self._config_mtime: Optional[int] = None
         self.logger = logging.getLogger(self.__class__.__name__)
         self._load_configs()
+        self.set_field_workers(field_workers)
+
+    @property
+    def extractors(self) -> Dict[str, DataExtractor]:
+        """source_id到提取器的映射（只读视图）"""
+        return dict(zip(self._source_ids, self._extractors))
+
+    @property
+    def configs(self) -> Dict[str, Dict[str, Any]]:
+        """source_id到配置的映射（只读视图）"""
+        return dict(zip(self._source_ids, self._configs))
+
+    def _add_source(
+        self,
+        source_id: str,
+        config: Dict[str, Any],
+        config_hash: int,
+        extractor: Optional[DataExtractor] = None,
+    ):
+        """
+        添加一个新闻源到平行列表并建立索引
+
+        Args:
+            source_id: 新闻源ID
+            config: 新闻源配置
+            config_hash: 配置内容的哈希值
+            extractor: 可复用的提取器，为None时新建
+        """
+        idx = len(self._source_ids)
+        self._source_ids.append(source_id)
+        self._configs.append(config)
+        if extractor is None:
+            extractor = DataExtractor(config)
+            extractor.executor = self._executor
+        self._extractors.append(extractor)
+        self._config_hashes.append(config_hash)
+        self._index[source_id] = idx
+
+        domain = config.get("domain")
+        if domain:
+            self._domain_to_idx.setdefault(domain.lower(), idx)
+
+    def _clear(self):
+        """清空所有已加载的新闻源"""
+        self._source_ids.clear()
+        self._configs.clear()
+        self._extractors.clear()
+        self._config_hashes.clear()
+        self._index.clear()
+        self._domain_to_idx.clear()
+
+    def _load_configs(self, previous: Optional[Dict[str, tuple]] = None):
+        """
+        加载所有新闻源配置
 
-    def _load_configs(self):
-        """加载所有新闻源配置"""
+        Args:
+            previous: 上次加载的 {source_id: (配置哈希, 提取器)}，
+                     配置未变化的新闻源直接复用原提取器
+        """
         config_file = Path(self.config_path)
 
         if not config_file.exists():
             self.logger.error(f"配置文件不存在: {self.config_path}")
             return
 
+        previous = previous or {}
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                configs = json.load(f)
+            mtime = config_file.stat().st_mtime_ns
+            if orjson is not None:
+                configs = orjson.loads(config_file.read_bytes())
+            else:
+                with open(config_file, "r", encoding="utf-8") as f:
+                    configs = json.load(f)
+            self._config_mtime = mtime
 
             loaded_count = 0
             for source_id, config in configs.items():
                 if config.get("enabled", True):
-                    self.configs[source_id] = config
-                    self.extractors[source_id] = DataExtractor(config)
+                    config_hash = hash(json.dumps(config, sort_keys=True))
+                    old_hash, extractor = previous.get(source_id, (None, None))
+                    if old_hash == config_hash:
+                        # 内容相同，沿用原配置对象以与提取器保持一致
+                        config = extractor.config
+                    else:
+                        extractor = None
+                    self._add_source(source_id, config, config_hash, extractor)
                     loaded_count += 1
                     self.logger.info(
                         f'✓ 加载新闻源: {source_id} ({config.get("name")})'
@@ -371,7 +869,8 @@ class MultiSiteExtractor:
         Returns:
             数据提取器实例，如果不存在返回None
         """
-        return self.extractors.get(source_id)
+        idx = self._index.get(source_id)
+        return None if idx is None else self._extractors[idx]
 
     def get_config(self, source_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -383,7 +882,27 @@ class MultiSiteExtractor:
         Returns:
             配置字典，如果不存在返回None
         """
-        return self.configs.get(source_id)
+        idx = self._index.get(source_id)
+        return None if idx is None else self._configs[idx]
+
+    def get_source_by_domain(self, hostname: str) -> Optional[str]:
+        """
+        根据主机名查找新闻源ID
+        依次去掉最左侧的子域名查找，如 edition.cnn.com -> cnn.com
+
+        Args:
+            hostname: 主机名
+
+        Returns:
+            新闻源ID，如果不存在返回None
+        """
+        host = hostname.lower()
+        while host:
+            idx = self._domain_to_idx.get(host)
+            if idx is not None:
+                return self._source_ids[idx]
+            _, _, host = host.partition(".")
+        return None
 
     def get_all_sources(self) -> List[str]:
         """
@@ -392,13 +911,54 @@ class MultiSiteExtractor:
         Returns:
             新闻源ID列表
         """
-        return list(self.extractors.keys())
+        return list(self._source_ids)
+
+    def set_field_workers(self, field_workers: int):
+        """
+        设置字段并行提取的线程数
+        字段较多、页面较大时并行提取可以利用lxml释放GIL的时间
+
+        Args:
+            field_workers: 线程数，0表示串行提取
+        """
+        self.close()
+        if field_workers > 0:
+            self._executor = ThreadPoolExecutor(
+                max_workers=field_workers, thread_name_prefix="field-extract"
+            )
+            self.logger.info(f"字段并行提取已启用: {field_workers} 个线程")
+        for extractor in self._extractors:
+            extractor.executor = self._executor
+
+    def close(self):
+        """关闭字段提取线程池"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            for extractor in self._extractors:
+                extractor.executor = None
 
     def reload_configs(self):
-        """重新加载配置文件"""
-        self.extractors.clear()
-        self.configs.clear()
-        self._load_configs()
+        """
+        重新加载配置文件
+        文件修改时间未变化时直接返回，只为配置有变化的新闻源重建提取器
+        """
+        try:
+            mtime = Path(self.config_path).stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime is not None and mtime == self._config_mtime:
+            self.logger.info("配置文件未变化，无需重新加载")
+            return
+
+        previous = {
+            source_id: (config_hash, extractor)
+            for source_id, config_hash, extractor in zip(
+                self._source_ids, self._config_hashes, self._extractors
+            )
+        }
+        self._clear()
+        self._load_configs(previous)
         self.logger.info("配置文件已重新加载")
 
 
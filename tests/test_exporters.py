@@ -0,0 +1,49 @@
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+import scrapy
+from scrapy.exporters import JsonLinesItemExporter
+
+from news_scraper.exporters import OrjsonItemExporter
+
+
+class _Nested(scrapy.Item):
+    x = scrapy.Field()
+
+
+class _Item(scrapy.Item):
+    title = scrapy.Field()
+    tags = scrapy.Field()
+    nested = scrapy.Field()
+    crawl_time = scrapy.Field()
+    score = scrapy.Field()
+
+
+def _export(exporter_cls, item, **kwargs):
+    buf = io.BytesIO()
+    exporter = exporter_cls(buf, **kwargs)
+    exporter.start_exporting()
+    exporter.export_item(item)
+    exporter.finish_exporting()
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", None])
+def test_orjson_exporter_matches_json_lines_exporter(encoding):
+    pytest.importorskip("orjson")
+    item = _Item(
+        title="Café",
+        tags={"x"},
+        nested=_Nested(x="é"),
+        crawl_time=datetime(2024, 12, 21, 10, 30, 0, 123456),
+        score=Decimal("1.5"),
+    )
+    expected = _export(JsonLinesItemExporter, item, encoding=encoding)
+    output = _export(OrjsonItemExporter, item, encoding=encoding)
+
+    assert json.loads(output) == json.loads(expected)
+    assert json.loads(output)["tags"] == ["x"]
+    assert json.loads(output)["nested"] == {"x": "é"}
@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+
+import pytest
+from scrapy.http import HtmlResponse
+
+from news_scraper.utils.extractor import DataExtractor
+
+CONFIG_PATH = Path(__file__).parent.parent / "config" / "news_sources.json"
+
+LIST_PAGE = b"""
+<html><body>
+  <a class="container__link" href="/2024/12/21/world/first/index.html">1</a>
+  <a class="container__link" href="/2024/12/21/world/second/index.html">2</a>
+  <a class="container__link" href="/2024/12/21/world/third/index.html">3</a>
+</body></html>
+"""
+
+EXPECTED_LINKS = [
+    "/2024/12/21/world/first/index.html",
+    "/2024/12/21/world/second/index.html",
+    "/2024/12/21/world/third/index.html",
+]
+
+
+@pytest.fixture(scope="module")
+def cnn_extractor():
+    with open(CONFIG_PATH, encoding="utf-8") as f:
+        return DataExtractor(json.load(f)["cnn"])
+
+
+@pytest.fixture
+def list_response():
+    return HtmlResponse(
+        url="https://edition.cnn.com/world", body=LIST_PAGE, encoding="utf-8"
+    )
+
+
+def test_extract_field_returns_all_article_links(cnn_extractor, list_response):
+    field_config = cnn_extractor.config["selectors"]["article_links"]
+    links = cnn_extractor.extract_field(list_response, "article_links", field_config)
+    assert links == EXPECTED_LINKS
+
+
+def test_extract_all_fields_returns_all_article_links(cnn_extractor, list_response):
+    data = cnn_extractor.extract_all_fields(list_response)
+    assert data["article_links"] == EXPECTED_LINKS
+
+
+def test_xpath_selectors_support_exslt_namespaces(list_response):
+    extractor = DataExtractor(
+        {
+            "name": "exslt",
+            "selectors": {
+                "links": {
+                    "xpath": ["set:distinct(//a[re:test(@href, 'world')]/@href)"],
+                    "priority": "xpath",
+                    "multi": True,
+                }
+            },
+        }
+    )
+    links = extractor.extract_field(
+        list_response, "links", extractor.config["selectors"]["links"]
+    )
+    assert links == EXPECTED_LINKS
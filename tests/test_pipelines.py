@@ -0,0 +1,119 @@
+import logging
+
+import pytest
+from scrapy.exceptions import DropItem
+
+from news_scraper import pipelines
+from news_scraper.pipelines import (
+    DataCleaningPipeline,
+    DeduplicationPipeline,
+    MongoDBPipeline,
+    _item_hash,
+    _strip_tracking_params,
+)
+
+
+def test_deduplication_accepts_non_hex_news_id():
+    pipeline = DeduplicationPipeline()
+    item = {"url": "https://example.com/a", "news_id": "custom-id"}
+
+    assert pipeline.process_item(dict(item), None) == item
+    with pytest.raises(DropItem):
+        pipeline.process_item(dict(item), None)
+    assert pipeline.duplicate_count == 1
+
+
+def test_deduplication_hex_news_id():
+    pipeline = DeduplicationPipeline()
+    item = {"url": "https://example.com/a", "news_id": "0123456789abcdef"}
+
+    pipeline.process_item(dict(item), None)
+    with pytest.raises(DropItem):
+        pipeline.process_item(dict(item), None)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/a?abc",
+        "https://example.com/a?q=hello%20world",
+        "https://example.com/a?x=1;y=2",
+        "https://example.com/a?id=1&page=2#top",
+    ],
+)
+def test_strip_tracking_params_keeps_url_without_tracking_keys(url):
+    assert _strip_tracking_params(url) == url
+
+
+def test_strip_tracking_params_removes_only_tracking_keys():
+    url = "https://example.com/a?abc&utm_source=x&q=hello%20world&fbclid=1#top"
+    expected = "https://example.com/a?abc&q=hello%20world#top"
+    assert _strip_tracking_params(url) == expected
+    assert _strip_tracking_params("https://example.com/a?utm_medium=x") == (
+        "https://example.com/a"
+    )
+
+
+def test_time_standardization_matches_date_parser():
+    pipeline = DataCleaningPipeline()
+    # 斜杠日期与DateParser一致，按日/月/年解析
+    assert pipeline._standardize_time("03/04/2024") == "2024-04-03T00:00:00"
+    assert pipeline._standardize_time("2024-12-21T10:30:00Z") == (
+        "2024-12-21T10:30:00+00:00"
+    )
+    assert pipeline._standardize_time("not a date") == "not a date"
+
+
+def test_item_hash_covers_all_fields_except_crawl_time():
+    item = {"url": "https://example.com/a", "title": "Old", "content": "Body"}
+    base = _item_hash(item)
+
+    assert _item_hash(dict(item, crawl_time="2024-12-21T10:30:00")) == base
+    assert _item_hash(dict(item, title="New")) != base
+    assert _item_hash(dict(item, tags=["x"])) != base
+
+
+class _FakeSpider:
+    crawler = None
+    logger = logging.getLogger("test")
+
+
+class _FakeCollection:
+    def __init__(self, error):
+        self.error = error
+
+    def bulk_write(self, ops, **kwargs):
+        raise self.error
+
+
+def test_flush_counts_only_url_duplicates_as_unchanged():
+    errors = pytest.importorskip("pymongo.errors")
+    pipeline = MongoDBPipeline("mongodb://localhost", "db", "news")
+    write_errors = errors.BulkWriteError(
+        {
+            "writeErrors": [
+                {"code": 11000, "keyPattern": {"url": 1}},
+                {"code": 11000, "keyPattern": {"news_id": 1}, "errmsg": "dup"},
+            ]
+        }
+    )
+    pipeline.collection = _FakeCollection(write_errors)
+    pipeline._buf = [object(), object()]
+
+    pipeline._flush(_FakeSpider())
+
+    assert pipeline.unchanged_count == 1
+    assert pipeline.failed_count == 1
+
+
+def test_client_cache_is_keyed_by_compressors(monkeypatch):
+    pymongo = pytest.importorskip("pymongo")
+    monkeypatch.setattr(pymongo, "MongoClient", lambda uri, **options: options)
+    monkeypatch.setattr(pipelines, "_CLIENT_CACHE", {})
+
+    plain = pipelines._get_client("mongodb://localhost")
+    zlib = pipelines._get_client("mongodb://localhost", "zlib")
+
+    assert "compressors" not in plain
+    assert zlib["compressors"] == "zlib"
+    assert pipelines._get_client("mongodb://localhost", "zlib") is zlib
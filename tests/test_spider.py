@@ -0,0 +1,54 @@
+import pytest
+from scrapy.utils.test import get_crawler
+
+from news_scraper.spiders.universal_spider import UniversalNewsSpider
+
+
+@pytest.fixture(scope="module")
+def spider():
+    return UniversalNewsSpider(sources="cnn")
+
+
+@pytest.mark.parametrize(
+    "url, category",
+    [
+        ("https://edition.cnn.com/2024/12/21/world/story/index.html", "world"),
+        ("https://edition.cnn.com/2024/12/21/worldwide/story/index.html", "general"),
+        ("https://edition.cnn.com/2024/12/21/politics/story/index.html", "politics"),
+    ],
+)
+def test_extract_category_matches_whole_path_segment(spider, url, category):
+    assert spider._extract_category(url, "cnn") == category
+
+
+def test_is_valid_date_accepts_non_string_values(spider):
+    assert spider._is_valid_date(["2024-12-21T10:30:00Z"]) is True
+    assert spider._is_valid_date("2000-01-01T00:00:00Z") is False
+
+
+@pytest.mark.parametrize(
+    "url, source_id",
+    [
+        ("https://edition.cnn.com/world", "cnn"),
+        ("https://EDITION.CNN.COM/world", "cnn"),
+        ("https://cnn.com/", "cnn"),
+        ("https://example.com/world", None),
+    ],
+)
+def test_identify_source(spider, url, source_id):
+    assert spider._identify_source(url) == source_id
+
+
+def test_identify_source_is_limited_to_target_sources(spider, monkeypatch):
+    monkeypatch.delitem(spider._configs, "cnn")
+    assert spider._identify_source("https://edition.cnn.com/world") is None
+
+
+def test_from_crawler_reads_article_settings_once():
+    crawler = get_crawler(
+        UniversalNewsSpider, {"NEWS_ID_ALGO": "md5", "FAST_LOADER": False}
+    )
+    spider = UniversalNewsSpider.from_crawler(crawler, sources="cnn")
+
+    assert spider.news_id_algo == "md5"
+    assert spider.fast_loader is False